@@ -354,6 +354,12 @@ def _extract_xml_tool_calls(
 # ---------------------------------------------------------------------------
 
 
+_JSON_DECODER = json.JSONDecoder()
+# Only an object with a "name" key can be a tool call, so skip every "{" that
+# is not followed by a string key (code blocks, empty dicts, prose).
+_JSON_OBJECT_START = re.compile(r'\{\s*"')
+
+
 def _extract_tool_calls_from_text(
     text: str,
     known_tools: Set[str],
@@ -371,24 +377,12 @@ def _extract_tool_calls_from_text(
 
     calls: List[ToolCall] = []
 
-    # Strategy 1: JSON objects with "name" and "arguments"/"parameters"/"input"
-    for m in re.finditer(r"\{", text):
-        start = m.start()
-        depth = 0
-        end = start
-        for i in range(start, len(text)):
-            if text[i] == "{":
-                depth += 1
-            elif text[i] == "}":
-                depth -= 1
-                if depth == 0:
-                    end = i + 1
-                    break
-        if depth != 0:
-            continue
-        candidate = text[start:end]
+    # Strategy 1: JSON objects with "name" and "arguments"/"parameters"/"input".
+    # raw_decode parses the object starting at each '{"' in C and ignores
+    # whatever follows it, so no Python-level brace matching is needed.
+    for m in _JSON_OBJECT_START.finditer(text):
         try:
-            obj = json.loads(candidate)
+            obj, _ = _JSON_DECODER.raw_decode(text, m.start())
             name = obj.get("name", "")
             if name in known_tools:
                 params = obj.get("arguments") or obj.get("parameters") or obj.get("input") or {}
@@ -68,10 +68,15 @@ class ClaudeDirectProvider(AIProvider):
         if self._client is None:
             try:
                 import anthropic
+                import httpx
 
                 self._client = anthropic.Anthropic(
                     api_key=self.api_key,
                     base_url=self.base_url,
+                    # Same bounds as the Bedrock client: give up on a stalled
+                    # connection instead of waiting out the SDK's 10-minute
+                    # default.  The SDK's own 2 retries still apply.
+                    timeout=httpx.Timeout(120.0, connect=10.0),
                 )
             except ImportError as exc:
                 raise ImportError(
@@ -74,9 +74,13 @@ class OpenAIProvider(AIProvider):
         """
         if self._client is None:
             try:
+                import httpx
                 import openai
 
-                kwargs: Dict[str, Any] = {"api_key": self.api_key}
+                # Same bounds as the Bedrock client: give up on a stalled
+                # connection instead of waiting out the SDK's 10-minute
+                # default.  The SDK's own 2 retries still apply.
+                kwargs: Dict[str, Any] = {"api_key": self.api_key, "timeout": httpx.Timeout(120.0, connect=10.0)}
                 if self.organization:
                     kwargs["organization"] = self.organization
                 if self.base_url:
@@ -236,7 +236,7 @@ def classify_discussion(messages: List[ChatMessage], provider: AIProvider) -> Cl
         return ClassificationResult(discussion_type="general", confidence=0.0)
 
     prompt = get_classification_prompt(messages)
-    logger.info(f"Classifying discussion with {len(messages)} messages")
+    logger.info("Classifying discussion with %s messages", len(messages))
 
     # Call the provider
     response_text = provider.call_model(prompt)
@@ -246,7 +246,7 @@ def classify_discussion(messages: List[ChatMessage], provider: AIProvider) -> Cl
     try:
         data = json.loads(response_text)
     except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse classification JSON: {response_text}")
+        logger.error("Failed to parse classification JSON: %s", response_text)
         raise ValueError(f"Invalid JSON response from classification: {e}") from e
 
     discussion_type = data.get("discussion_type", "general")
@@ -255,10 +255,10 @@ def classify_discussion(messages: List[ChatMessage], provider: AIProvider) -> Cl
     # Validate discussion type
     valid_types = ["api_design", "product_flow", "code_change", "architecture", "innovation", "debugging", "general"]
     if discussion_type not in valid_types:
-        logger.warning(f"Invalid discussion type '{discussion_type}', defaulting to 'general'")
+        logger.warning("Invalid discussion type '%s', defaulting to 'general'", discussion_type)
         discussion_type = "general"
 
-    logger.info(f"Classification result: {discussion_type} (confidence: {confidence:.2f})")
+    logger.info("Classification result: %s (confidence: %.2f)", discussion_type, confidence)
     return ClassificationResult(discussion_type=discussion_type, confidence=confidence)
 
 
@@ -286,7 +286,7 @@ def generate_targeted_summary(
         return PipelineSummary(discussion_type=discussion_type)
 
     prompt = get_targeted_summary_prompt(messages, discussion_type)
-    logger.info(f"Generating targeted summary for type: {discussion_type}")
+    logger.info("Generating targeted summary for type: %s", discussion_type)
 
     # Call the provider
     response_text = provider.call_model(prompt)
@@ -296,7 +296,7 @@ def generate_targeted_summary(
     try:
         data = json.loads(response_text)
     except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse summary JSON: {response_text}")
+        logger.error("Failed to parse summary JSON: %s", response_text)
         raise ValueError(f"Invalid JSON response from summary: {e}") from e
 
     # Build PipelineSummary with validated fields
@@ -313,7 +313,7 @@ def generate_targeted_summary(
         discussion_type=discussion_type,
     )
 
-    logger.info(f"Generated summary: topic='{summary.topic}', requires_code_change={summary.requires_code_change}")
+    logger.info("Generated summary: topic='%s', requires_code_change=%s", summary.topic, summary.requires_code_change)
     return summary
 
 
@@ -399,7 +399,7 @@ def extract_code_relevant_items(
         ValueError: If extraction fails or JSON parsing fails.
     """
     prompt = get_code_relevant_items_prompt(summary)
-    logger.info(f"Extracting code-relevant items for topic: {summary.topic}")
+    logger.info("Extracting code-relevant items for topic: %s", summary.topic)
 
     response_text = provider.call_model(prompt)
     response_text = _strip_markdown_code_block(response_text)
@@ -407,11 +407,11 @@ def extract_code_relevant_items(
     try:
         data = json.loads(response_text)
     except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse code-relevant items JSON: {response_text}")
+        logger.error("Failed to parse code-relevant items JSON: %s", response_text)
         raise ValueError(f"Invalid JSON response from code-relevant items extraction: {e}") from e
 
     if not isinstance(data, list):
-        logger.error(f"Expected JSON array, got: {type(data)}")
+        logger.error("Expected JSON array, got: %s", type(data))
         raise ValueError("Expected JSON array for code-relevant items")
 
     valid_types = {"api_design", "code_change", "product_flow", "architecture", "debugging"}
@@ -446,7 +446,7 @@ def extract_code_relevant_items(
     for i, item in enumerate(items):
         item.id = f"item-{i + 1}"
 
-    logger.info(f"Extracted {len(items)} code-relevant items")
+    logger.info("Extracted %s code-relevant items", len(items))
     return items
 
 
@@ -469,7 +469,7 @@ def run_summary_pipeline(messages: List[ChatMessage], provider: AIProvider) -> P
     Raises:
         ValueError: If any stage fails.
     """
-    logger.info(f"Starting summary pipeline with {len(messages)} messages")
+    logger.info("Starting summary pipeline with %s messages", len(messages))
 
     # Stage 1: Classification
     classification = classify_discussion(messages, provider)
@@ -492,17 +492,19 @@ def run_summary_pipeline(messages: List[ChatMessage], provider: AIProvider) -> P
         try:
             summary.code_relevant_items = extract_code_relevant_items(summary, provider)
         except Exception as e:
-            logger.warning(f"Stage 4 (item extraction) failed: {e}")
+            logger.warning("Stage 4 (item extraction) failed: %s", e)
             if summary.requires_code_change:
                 summary.code_relevant_items = [_fallback_item_from_summary(summary)]
             # Otherwise leave as empty list
 
     logger.info(
-        f"Pipeline complete: type={summary.discussion_type}, "
-        f"confidence={summary.classification_confidence:.2f}, "
-        f"requires_code_change={summary.requires_code_change}, "
-        f"code_relevant_types={summary.code_relevant_types}, "
-        f"code_relevant_items={len(summary.code_relevant_items)}"
+        "Pipeline complete: type=%s, confidence=%.2f, requires_code_change=%s, "
+        "code_relevant_types=%s, code_relevant_items=%s",
+        summary.discussion_type,
+        summary.classification_confidence,
+        summary.requires_code_change,
+        summary.code_relevant_types,
+        len(summary.code_relevant_items),
     )
 
     return summary
@@ -8,6 +8,7 @@ Endpoints:
     POST /ai/code-prompt - Generate a code prompt from a decision summary (supports multi-type)
 """
 
+import asyncio
 import logging
 from typing import List, Literal, Optional
 
@@ -423,8 +424,9 @@ async def summarize_messages(request: SummarizeRequest) -> DecisionSummaryRespon
     chat_messages = [ChatMessage(role=msg.role, text=msg.text, timestamp=msg.timestamp) for msg in request.messages]
 
     try:
-        # Use the two-stage pipeline for improved summarization
-        pipeline_summary = call_summary_pipeline(chat_messages)
+        # Use the two-stage pipeline for improved summarization. It makes
+        # blocking provider calls, so run it off the event loop.
+        pipeline_summary = await asyncio.to_thread(call_summary_pipeline, chat_messages)
 
         # Convert to DecisionSummary for backward compatibility
         summary = pipeline_summary_to_decision_summary(pipeline_summary)
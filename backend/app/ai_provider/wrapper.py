@@ -111,7 +111,7 @@ def _get_active_provider():
             ", ".join([f"{p.name}={'healthy' if p.healthy else 'unhealthy'}" for p in status.providers])
             or "no providers configured"
         )
-        logger.warning(f"AI provider call failed: no active provider. Status: {provider_info}")
+        logger.warning("AI provider call failed: no active provider. Status: %s", provider_info)
         raise ProviderNotAvailableError(
             "No active AI provider available. Please check provider configuration and API keys."
         )
@@ -140,23 +140,23 @@ def call_summary(messages: List[ChatMessage]) -> DecisionSummary:
     """
     provider, provider_name, _ = _get_active_provider()
 
-    logger.info(f"Calling summary with provider: {provider_name}, messages: {len(messages)}")
+    logger.info("Calling summary with provider: %s, messages: %s", provider_name, len(messages))
 
     try:
         summary = provider.summarize_structured(messages)
-        logger.info(f"Successfully generated summary with provider: {provider_name}")
+        logger.info("Successfully generated summary with provider: %s", provider_name)
         return summary
 
     except ValueError as e:
         # ValueError is raised when JSON parsing fails in the provider
         error_msg = str(e)
-        logger.error(f"JSON parsing error from provider {provider_name}: {error_msg}")
+        logger.error("JSON parsing error from provider %s: %s", provider_name, error_msg)
         raise JSONParseError(error_msg, provider_name) from e
 
     except Exception as e:
         # Catch-all for other provider errors (API errors, network issues, etc.)
         error_msg = str(e)
-        logger.error(f"Provider {provider_name} error during summarization: {error_msg}")
+        logger.error("Provider %s error during summarization: %s", provider_name, error_msg)
         raise ProviderCallError(error_msg, provider_name) from e
 
 
@@ -188,7 +188,7 @@ def call_code_prompt(
     Returns:
         str: Formatted code prompt for code generation.
     """
-    logger.info(f"Generating code prompt for {len(affected_components)} components")
+    logger.info("Generating code prompt for %s components", len(affected_components))
 
     policy_str = _load_policy_constraints()
     output_mode = room_output_mode or _get_output_mode()
@@ -203,7 +203,7 @@ def call_code_prompt(
         .build()
     )
 
-    logger.debug(f"Generated code prompt with {len(code_prompt)} characters")
+    logger.debug("Generated code prompt with %s characters", len(code_prompt))
     return code_prompt
 
 
@@ -238,7 +238,7 @@ def call_code_prompt_from_items(
     Returns:
         str: Formatted code prompt for code generation.
     """
-    logger.info(f"Generating code prompt from {len(items)} selected items")
+    logger.info("Generating code prompt from %s selected items", len(items))
 
     risk_order = {"low": 0, "medium": 1, "high": 2}
     risk_reverse = {0: "low", 1: "medium", 2: "high"}
@@ -291,7 +291,7 @@ def call_code_prompt_from_items(
 
     code_prompt = builder.build()
 
-    logger.debug(f"Generated item-based code prompt with {len(code_prompt)} characters")
+    logger.debug("Generated item-based code prompt with %s characters", len(code_prompt))
     return code_prompt
 
 
@@ -351,26 +351,28 @@ def call_summary_pipeline(messages: List[ChatMessage]) -> PipelineSummary:
     """
     provider, provider_name, _ = _get_active_provider()
 
-    logger.info(f"Starting summary pipeline with provider: {provider_name}, messages: {len(messages)}")
+    logger.info("Starting summary pipeline with provider: %s, messages: %s", provider_name, len(messages))
 
     try:
         summary = run_summary_pipeline(messages, provider)
         logger.info(
-            f"Pipeline complete with provider: {provider_name}, "
-            f"type={summary.discussion_type}, confidence={summary.classification_confidence:.2f}"
+            "Pipeline complete with provider: %s, type=%s, confidence=%.2f",
+            provider_name,
+            summary.discussion_type,
+            summary.classification_confidence,
         )
         return summary
 
     except ValueError as e:
         # ValueError is raised when JSON parsing fails in the pipeline
         error_msg = str(e)
-        logger.error(f"JSON parsing error in pipeline from {provider_name}: {error_msg}")
+        logger.error("JSON parsing error in pipeline from %s: %s", provider_name, error_msg)
         raise JSONParseError(error_msg, provider_name) from e
 
     except Exception as e:
         # Catch-all for other errors
         error_msg = str(e)
-        logger.error(f"Provider {provider_name} error during pipeline: {error_msg}")
+        logger.error("Provider %s error during pipeline: %s", provider_name, error_msg)
         raise ProviderCallError(error_msg, provider_name) from e
 
 
@@ -449,11 +451,11 @@ def filter_code_relevant_summaries(
 
         if disc_type in code_relevant_types:
             filtered.append(summary)
-            logger.debug(f"Including summary of type '{disc_type}' in code prompt")
+            logger.debug("Including summary of type '%s' in code prompt", disc_type)
         else:
-            logger.debug(f"Excluding summary of type '{disc_type}' - not in code_relevant_types")
+            logger.debug("Excluding summary of type '%s' - not in code_relevant_types", disc_type)
 
-    logger.info(f"Filtered {len(summaries)} summaries to {len(filtered)} code-relevant summaries")
+    logger.info("Filtered %s summaries to %s code-relevant summaries", len(summaries), len(filtered))
     return filtered
 
 
@@ -488,7 +490,9 @@ def call_selective_code_prompt(
         Tuple of (code_prompt_str, filtered_types_used)
     """
     logger.info(
-        f"Generating selective code prompt with {len(summaries)} summaries, code_relevant_types={code_relevant_types}"
+        "Generating selective code prompt with %s summaries, code_relevant_types=%s",
+        len(summaries),
+        code_relevant_types,
     )
 
     # Filter to only code-relevant summaries
@@ -519,7 +523,7 @@ def call_selective_code_prompt(
         output_mode=output_mode,
     )
 
-    logger.info(f"Generated selective code prompt with {len(code_prompt)} characters, using types: {types_used}")
+    logger.info("Generated selective code prompt with %s characters, using types: %s", len(code_prompt), types_used)
 
     return code_prompt, types_used
 
@@ -556,7 +560,7 @@ def _load_policy_constraints() -> Optional[str]:
             forbidden_paths=FORBIDDEN_PATHS,
         )
     except Exception as e:
-        logger.debug(f"Could not load policy constraints: {e}")
+        logger.debug("Could not load policy constraints: %s", e)
         return None
 
 
@@ -595,10 +599,12 @@ def _load_style_guidelines(
                     parts.append(_read_builtin_style(lang_enum))
                     loaded_languages.append(lang_str)
                 except (ValueError, FileNotFoundError):
-                    logger.debug(f"Skipping unknown/missing language style: {lang_str}")
+                    logger.debug("Skipping unknown/missing language style: %s", lang_str)
 
             logger.info(
-                f"Loaded style guidelines for detected languages: {loaded_languages} (requested: {detected_languages})"
+                "Loaded style guidelines for detected languages: %s (requested: %s)",
+                loaded_languages,
+                detected_languages,
             )
 
             if len(parts) > 1:
@@ -606,7 +612,7 @@ def _load_style_guidelines(
             # Only universal was loaded (all languages were invalid)
             return parts[0]
         except Exception as e:
-            logger.debug(f"Could not load detected language styles: {e}")
+            logger.debug("Could not load detected language styles: %s", e)
 
     try:
         from app.agent.style_loader import CodeStyleLoader
@@ -616,6 +622,6 @@ def _load_style_guidelines(
         if style:
             return style
     except Exception as e:
-        logger.debug(f"Could not load style guidelines: {e}")
+        logger.debug("Could not load style guidelines: %s", e)
 
     return None
@@ -25,14 +25,18 @@ Performance Notes:
     - Failed connections are automatically removed during broadcast
     - Uvicorn handles ping/pong at the protocol level (default 20s interval)
     - Message deduplication uses OrderedDict as LRU cache (O(1) lookup)
+    - Per-room history is capped at MAX_ROOM_HISTORY; since/before lookups
+      bisect on message ts (O(log n) + page size)
 """
 
 import asyncio
+import bisect
 import logging
 import time
 import uuid
 from collections import OrderedDict
 from enum import Enum
+from operator import attrgetter
 from typing import Dict, List, Optional, Set, Tuple
 
 from fastapi import WebSocket
@@ -53,6 +57,14 @@ DEFAULT_PAGE_SIZE = 50
 # Maximum page size to prevent abuse
 MAX_PAGE_SIZE = 100
 
+# Maximum number of messages kept in memory per room. Older messages are
+# evicted from the in-memory history; readers that reach past the eviction
+# point fall back to Postgres (see has_evicted_history).
+MAX_ROOM_HISTORY = 5000
+
+# Sort key for bisecting a room's history (messages are appended in ts order)
+_message_ts = attrgetter("ts")
+
 
 # =============================================================================
 # Data Models
@@ -223,6 +235,10 @@ class ConnectionManager:
         # room_id -> list of messages (append-only history)
         self.message_history: Dict[str, List[ChatMessage]] = {}
 
+        # room_id -> ts of the newest message evicted by MAX_ROOM_HISTORY.
+        # Set once a room's in-memory history is only a suffix of its messages.
+        self.history_evicted_ts: Dict[str, float] = {}
+
         # room_id -> {userId -> RoomUser}
         self.room_users: Dict[str, Dict[str, RoomUser]] = {}
 
@@ -295,10 +311,10 @@ class ConnectionManager:
             self.room_hosts[room_id] = user_id
             self.room_leads[room_id] = user_id
             role = "host"
-            logger.info(f"[Manager] User {user_id} is HOST and LEAD of room {room_id}")
+            logger.info("[Manager] User %s is HOST and LEAD of room %s", user_id, room_id)
         else:
             role = "guest"
-            logger.info(f"[Manager] User {user_id} is GUEST in room {room_id}")
+            logger.info("[Manager] User %s is GUEST in room %s", user_id, room_id)
 
         self.active_connections[room_id].append(websocket)
 
@@ -384,7 +400,7 @@ class ConnectionManager:
                 "email": sso_email.lower().strip(),
                 "provider": sso_provider,
             }
-            logger.info(f"[Manager] Stored SSO host identity for room {room_id}: {sso_email} via {sso_provider}")
+            logger.info("[Manager] Stored SSO host identity for room %s: %s via %s", room_id, sso_email, sso_provider)
 
         return user
 
@@ -445,7 +461,7 @@ class ConnectionManager:
                 if host_id and host_id != user_id and host_id in self.room_users.get(room_id, {}):
                     self.room_leads[room_id] = host_id
                     lead_reverted = True
-                    logger.info(f"[Manager] Lead reverted to host {host_id} in room {room_id}")
+                    logger.info("[Manager] Lead reverted to host %s in room %s", host_id, room_id)
 
             del self.websocket_to_user[websocket]
 
@@ -461,9 +477,7 @@ class ConnectionManager:
         Returns:
             The same message (for chaining).
         """
-        if room_id not in self.message_history:
-            self.message_history[room_id] = []
-        self.message_history[room_id].append(message)
+        self.load_history(room_id, [message])
         msg_dict = message.model_dump()
 
         # Local mode: skip Redis/Postgres — extension stores messages locally
@@ -555,7 +569,7 @@ class ConnectionManager:
             await connection.send_json(message)
             return True
         except Exception as e:
-            logger.debug(f"Failed to send to connection: {e}")
+            logger.debug("Failed to send to connection: %s", e)
             return False
 
     def _cleanup_connections(self, room_id: str, failed_connections: List[WebSocket]) -> None:
@@ -571,7 +585,7 @@ class ConnectionManager:
         for conn in failed_connections:
             if conn in self.active_connections[room_id]:
                 self.active_connections[room_id].remove(conn)
-                logger.debug(f"Removed dead connection from room {room_id}")
+                logger.debug("Removed dead connection from room %s", room_id)
 
     def get_room_size(self, room_id: str) -> int:
         """Get the number of active connections in a room."""
@@ -585,12 +599,44 @@ class ConnectionManager:
         """Get the message history for a room."""
         return self.message_history.get(room_id, [])
 
+    def load_history(self, room_id: str, messages: List[ChatMessage]) -> List[ChatMessage]:
+        """Append messages (in ts order) to a room's in-memory history.
+
+        Evicts the oldest messages once the room exceeds MAX_ROOM_HISTORY and
+        records the eviction point for :meth:`has_evicted_history`.
+
+        Returns:
+            The room's history after appending.
+        """
+        history = self.message_history.setdefault(room_id, [])
+        history.extend(messages)
+        overflow = len(history) - MAX_ROOM_HISTORY
+        if overflow > 0:
+            self.history_evicted_ts[room_id] = history[overflow - 1].ts
+            del history[:overflow]
+        return history
+
+    def has_evicted_history(self, room_id: str, newer_than: Optional[float] = None) -> bool:
+        """Check whether MAX_ROOM_HISTORY has evicted messages from a room.
+
+        Once it has, the in-memory history no longer holds the whole room and
+        lookups that reach past its oldest message must ask Postgres.
+
+        Args:
+            room_id: The room ID.
+            newer_than: If given, only count evicted messages with ts > newer_than
+                        (i.e. whether a since-cursor reaches into evicted history).
+        """
+        evicted_ts = self.history_evicted_ts.get(room_id)
+        return evicted_ts is not None and (newer_than is None or evicted_ts > newer_than)
+
     async def clear_message_history(self, room_id: str) -> None:
         """Clear only message-related state; preserves live connections and user list.
 
         Called when a non-SSO host disconnects.
         """
         self.message_history.pop(room_id, None)
+        self.history_evicted_ts.pop(room_id, None)
         self.seen_message_ids.pop(room_id, None)
         self.message_read_by.pop(room_id, None)
         if self._redis_store:
@@ -612,6 +658,7 @@ class ConnectionManager:
         # Remove all room data
         self.active_connections.pop(room_id, None)
         self.message_history.pop(room_id, None)
+        self.history_evicted_ts.pop(room_id, None)
         self.room_users.pop(room_id, None)
         self.guest_counters.pop(room_id, None)
         self.seen_message_ids.pop(room_id, None)
@@ -730,7 +777,7 @@ class ConnectionManager:
         if new_lead_id not in self.room_users.get(room_id, {}):
             return False
         self.room_leads[room_id] = new_lead_id
-        logger.info(f"[Manager] Lead transferred to {new_lead_id} in room {room_id}")
+        logger.info("[Manager] Lead transferred to %s in room %s", new_lead_id, room_id)
         return True
 
     def can_use_ai(self, room_id: str, user_id: str) -> bool:
@@ -796,7 +843,7 @@ class ConnectionManager:
             self.room_leads[room_id] = user_id
             if room_id in self.room_users and user_id in self.room_users[room_id]:
                 self.room_users[room_id][user_id].role = UserRole.HOST
-            logger.info(f"[Manager] SSO host role restored to user {user_id} in room {room_id}")
+            logger.info("[Manager] SSO host role restored to user %s in room %s", user_id, room_id)
             return True
         return False
 
@@ -1068,7 +1115,8 @@ class ConnectionManager:
             List of messages newer than since_ts.
         """
         messages = self.message_history.get(room_id, [])
-        return [msg for msg in messages if msg.ts > since_ts]
+        start = bisect.bisect_right(messages, since_ts, key=_message_ts)
+        return messages[start:]
 
     def get_paginated_history(
         self, room_id: str, before_ts: Optional[float] = None, limit: int = DEFAULT_PAGE_SIZE
@@ -1090,12 +1138,13 @@ class ConnectionManager:
         limit = min(limit, MAX_PAGE_SIZE)  # Prevent abuse
         messages = self.message_history.get(room_id, [])
 
+        end = len(messages)
         if before_ts is not None:
-            # Filter messages before the cursor
-            messages = [msg for msg in messages if msg.ts < before_ts]
+            # Messages before the cursor end at the first ts >= before_ts
+            end = bisect.bisect_left(messages, before_ts, key=_message_ts)
 
         # Return last N messages (most recent before cursor)
-        return messages[-limit:] if messages else []
+        return messages[max(0, end - limit) : end]
 
     # =========================================================================
     # Read Receipts
@@ -26,6 +26,24 @@ BATCH_SIZE = 3
 FLUSH_DELAY = 5.0  # seconds
 
 
+def _record_to_message(r, room_id: str) -> dict:
+    """Convert a ``ChatMessageRecord`` row back into a chat message dict."""
+    return {
+        "id": r.id,
+        "roomId": room_id,
+        "userId": r.user_id,
+        "displayName": r.display_name,
+        "role": r.role,
+        "type": r.type,
+        "content": r.content,
+        "identitySource": r.identity_source,
+        "parentMessageId": r.parent_message_id,
+        "aiData": json.loads(r.ai_data) if r.ai_data else None,
+        "metadata": json.loads(r.extra_data) if r.extra_data else None,
+        "ts": r.ts,
+    }
+
+
 class ChatPersistenceService:
     """Manages write-through micro-batch persistence to Postgres."""
 
@@ -307,24 +325,7 @@ class ChatPersistenceService:
                     q = q.where(ChatMessageRecord.ts > since_ts)
                 q = q.order_by(ChatMessageRecord.ts).limit(limit)
                 result = await session.execute(q)
-                rows = result.scalars().all()
-                return [
-                    {
-                        "id": r.id,
-                        "roomId": room_id,
-                        "userId": r.user_id,
-                        "displayName": r.display_name,
-                        "role": r.role,
-                        "type": r.type,
-                        "content": r.content,
-                        "identitySource": r.identity_source,
-                        "parentMessageId": r.parent_message_id,
-                        "aiData": json.loads(r.ai_data) if r.ai_data else None,
-                        "metadata": json.loads(r.extra_data) if r.extra_data else None,
-                        "ts": r.ts,
-                    }
-                    for r in rows
-                ]
+                return [_record_to_message(r, room_id) for r in result.scalars().all()]
         except Exception as exc:
             logger.warning("load_messages_from_postgres failed for %s: %s", room_id, exc)
             return []
@@ -400,6 +401,30 @@ class ChatPersistenceService:
         """Incremental sync: messages newer than *since_ts*."""
         return await self.load_messages_from_postgres(room_id, since_ts=since_ts, limit=limit)
 
+    async def get_messages_before(
+        self,
+        room_id: str,
+        before_ts: Optional[float],
+        limit: int = 50,
+    ) -> List[dict]:
+        """Paginated history: the newest *limit* messages older than *before_ts*, oldest first.
+
+        With ``before_ts=None`` returns the newest *limit* messages of the room.
+        """
+        try:
+            from ..db.models import ChatMessageRecord
+
+            async with self._session_factory() as session:
+                q = select(ChatMessageRecord).where(ChatMessageRecord.room_id == room_id)
+                if before_ts is not None:
+                    q = q.where(ChatMessageRecord.ts < before_ts)
+                q = q.order_by(ChatMessageRecord.ts.desc()).limit(limit)
+                result = await session.execute(q)
+                return [_record_to_message(r, room_id) for r in reversed(result.scalars().all())]
+        except Exception as exc:
+            logger.warning("get_messages_before failed for %s: %s", room_id, exc)
+            return []
+
     # ------------------------------------------------------------------
     # Shutdown
     # ------------------------------------------------------------------
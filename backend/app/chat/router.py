@@ -25,6 +25,7 @@ Protocol Message Types:
 """
 
 import html
+import json
 import logging
 import uuid
 from pathlib import Path
@@ -41,12 +42,14 @@ from app.files.service import FileStorageService
 from .manager import (
     DEFAULT_PAGE_SIZE,
     MAX_PAGE_SIZE,
+    MAX_ROOM_HISTORY,
     ChatMessage,
     MessageType,
+    RoomUser,
     UserRole,
     manager,
 )
-from .stack_trace_parser import parse_stack_trace
+from .stack_trace_parser import clear_parse_cache, parse_stack_trace
 
 router = APIRouter()
 
@@ -119,18 +122,33 @@ async def get_message_history(
         GET /chat/abc123/history?limit=50
         GET /chat/abc123/history?before=1707321600.123&limit=50
     """
-    messages = manager.get_paginated_history(room_id, before, limit)
+    messages = [m.model_dump() for m in manager.get_paginated_history(room_id, before, limit)]
 
     # Check if there are more messages before the oldest returned
     has_more = False
     if messages:
-        oldest_ts = messages[0].ts
+        oldest_ts = messages[0]["ts"]
         older_messages = manager.get_paginated_history(room_id, oldest_ts, 1)
         has_more = len(older_messages) > 0
 
+    # The page reached the oldest message still in memory, but the history cap
+    # evicted older ones: a full page just reports them, a short page is
+    # served from Postgres instead.
+    if not has_more and manager.has_evicted_history(room_id):
+        if len(messages) == limit:
+            has_more = True
+        else:
+            from app.main import app
+
+            persistence = getattr(app.state, "chat_persistence", None)
+            if persistence:
+                pg_msgs = await persistence.get_messages_before(room_id, before, limit=limit + 1)
+                if pg_msgs:
+                    has_more = len(pg_msgs) > limit
+                    messages = pg_msgs[-limit:]
+
     history_msgs = []
-    for msg in messages:
-        d = msg.model_dump()
+    for d in messages:
         if d.get("type") == "code_snippet" and d.get("metadata") and not d.get("codeSnippet"):
             d["codeSnippet"] = d["metadata"]
         history_msgs.append(d)
@@ -306,17 +324,12 @@ async def get_messages_after(
     Looks up the timestamp of *last_id*, then returns all messages with ts > that value.
     More robust than timestamp-based sync (avoids clock skew issues).
     """
-    # Try in-memory first
-    history = manager.message_history.get(room_id, [])
-    pivot_ts = None
-    for msg in history:
-        if msg.id == last_id:
-            pivot_ts = msg.ts
-            break
+    # Try in-memory first — scan from the newest end, where last_id usually is
+    pivot_ts = next((m.ts for m in reversed(manager.get_history(room_id)) if m.id == last_id), None)
 
     if pivot_ts is not None:
-        newer = [m.model_dump() for m in history if m.ts > pivot_ts]
-        return JSONResponse({"messages": newer[:limit], "source": "memory"})
+        newer = [m.model_dump() for m in manager.get_messages_since(room_id, pivot_ts)[:limit]]
+        return JSONResponse({"messages": newer, "source": "memory"})
 
     # Fall back to Postgres
     from app.main import app
@@ -360,11 +373,10 @@ async def get_messages_since(
 
     Checks in-memory first, then Postgres.
     """
-    # Try in-memory
-    history = manager.message_history.get(room_id, [])
-    newer = [m.model_dump() for m in history if m.ts > since]
-    if newer:
-        return JSONResponse({"messages": newer[:limit], "source": "memory"})
+    # Try in-memory, unless the history cap evicted messages newer than the cursor
+    newer = [m.model_dump() for m in manager.get_messages_since(room_id, since)[:limit]]
+    if newer and not manager.has_evicted_history(room_id, newer_than=since):
+        return JSONResponse({"messages": newer, "source": "memory"})
 
     # Fall back to Postgres
     from app.main import app
@@ -372,11 +384,72 @@ async def get_messages_since(
     persistence = getattr(app.state, "chat_persistence", None)
     if persistence:
         msgs = await persistence.get_messages_since(room_id, since, limit=limit)
-        return JSONResponse({"messages": msgs, "source": "postgres"})
+        if msgs or not newer:
+            return JSONResponse({"messages": msgs, "source": "postgres"})
+
+    # Nothing persisted (local-mode room or no Postgres): memory is all there is
+    if newer:
+        return JSONResponse({"messages": newer, "source": "memory"})
 
     return JSONResponse({"messages": [], "source": "none"})
 
 
+async def _handle_client_disconnect(websocket: WebSocket, room_id: str) -> None:
+    """Run the leave-room cleanup for a WebSocket client that went away.
+
+    Removes the connection from the manager, records the participant leaving,
+    notifies the remaining clients, and purges history when a non-SSO host
+    leaves.
+    """
+    # Capture identity BEFORE disconnect() removes the websocket mapping.
+    pre_info = manager.websocket_to_user.get(websocket)
+    pre_user_id = pre_info[1] if pre_info else None
+    is_host_disconnect = pre_user_id is not None and manager.is_host(room_id, pre_user_id)
+    host_had_sso = room_id in manager.room_sso_hosts
+
+    disconnected_user, lead_reverted = manager.disconnect(websocket, room_id)
+
+    if disconnected_user:
+        # Track participant leaving in Postgres
+        _persistence = getattr(manager, "_persistence", None)
+        if _persistence and pre_user_id:
+            try:
+                await _persistence.mark_participant_left(room_id, pre_user_id)
+            except Exception as exc:
+                logger.warning("[WS] mark_participant_left failed: %s", exc)
+
+        users_data = [u.model_dump() for u in manager.get_room_users(room_id)]
+        await manager.broadcast(
+            {"type": "user_left", "user": disconnected_user.model_dump(), "users": users_data}, room_id
+        )
+
+        # If lead reverted to host on disconnect, broadcast lead_changed
+        if lead_reverted:
+            new_lead_id = manager.get_lead_id(room_id)
+            logger.info("[WS] Lead reverted to host %s in room %s", new_lead_id, room_id)
+            await manager.broadcast({"type": "lead_changed", "leadId": new_lead_id}, room_id)
+
+    # Non-SSO host disconnect: purge history and audit logs.
+    if is_host_disconnect and not host_had_sso:
+        logger.info("[WS] Non-SSO host %s left room %s — clearing history and audit logs", pre_user_id, room_id)
+        await manager.clear_message_history(room_id)
+        # Memoised stack trace parses would keep the pasted text alive
+        clear_parse_cache()
+        try:
+            from app.audit.service import AuditLogService
+
+            await AuditLogService.get_instance().delete_room_logs(room_id)
+        except Exception as exc:
+            logger.error("[WS] Could not delete audit logs for room %s: %s", room_id, exc)
+        await manager.broadcast(
+            {
+                "type": "history_cleared",
+                "reason": "host_session_ended",
+            },
+            room_id,
+        )
+
+
 @router.websocket("/ws/chat/{room_id}")
 async def websocket_chat_endpoint(
     websocket: WebSocket,
@@ -412,12 +485,12 @@ async def websocket_chat_endpoint(
         since: Optional timestamp for message recovery on reconnect.
     """
     client_host = websocket.client.host if websocket.client else "unknown"
-    logger.info(f"[WS] New connection to room: {room_id}, since={since}, client={client_host}")
+    logger.info("[WS] New connection to room: %s, since=%s, client=%s", room_id, since, client_host)
 
     # Enforce max_participants from config (0 = no limit)
     max_participants = get_config().session.max_participants
     if max_participants > 0 and manager.get_room_size(room_id) >= max_participants:
-        logger.warning(f"[WS] Room {room_id} is full ({max_participants} participants). Rejecting new connection.")
+        logger.warning("[WS] Room %s is full (%d participants). Rejecting new connection.", room_id, max_participants)
         await websocket.close(code=1008)  # 1008 = Policy Violation
         return
 
@@ -425,11 +498,14 @@ async def websocket_chat_endpoint(
     try:
         assigned_user_id, assigned_role, history = await manager.connect(websocket, room_id)
     except Exception as exc:
-        logger.exception(f"[WS] manager.connect() raised an exception for room {room_id}: {exc}")
+        logger.exception("[WS] manager.connect() raised an exception for room %s: %s", room_id, exc)
         raise
     logger.info(
-        f"[WS] Connection accepted. Assigned userId={assigned_user_id}, role={assigned_role}. "
-        f"Room {room_id} now has {manager.get_room_size(room_id)} connections"
+        "[WS] Connection accepted. Assigned userId=%s, role=%s. Room %s now has %d connections",
+        assigned_user_id,
+        assigned_role,
+        room_id,
+        manager.get_room_size(room_id),
     )
 
     try:
@@ -444,7 +520,10 @@ async def websocket_chat_endpoint(
             }
         )
         logger.info(
-            f"[WS] Sent 'connected' with userId={assigned_user_id}, role={assigned_role}, leadId={manager.get_lead_id(room_id)}"
+            "[WS] Sent 'connected' with userId=%s, role=%s, leadId=%s",
+            assigned_user_id,
+            assigned_role,
+            manager.get_lead_id(room_id),
         )
 
         # Hydrate from Postgres if no in-memory history (room was idle / restarted)
@@ -457,20 +536,21 @@ async def websocket_chat_endpoint(
                         redis_store=manager._redis_store,
                     )
                     if pg_msgs:
-                        for m in pg_msgs:
-                            cm = ChatMessage(**m)
-                            if room_id not in manager.message_history:
-                                manager.message_history[room_id] = []
-                            manager.message_history[room_id].append(cm)
-                        history = manager.message_history.get(room_id, [])
-                        logger.info(f"[WS] Hydrated {len(pg_msgs)} messages from Postgres for room {room_id}")
+                        history = manager.load_history(room_id, [ChatMessage(**m) for m in pg_msgs])
+                        logger.info("[WS] Hydrated %d messages from Postgres for room %s", len(pg_msgs), room_id)
                 except Exception as exc:
-                    logger.warning(f"[WS] Room hydration failed for {room_id}: {exc}")
+                    logger.warning("[WS] Room hydration failed for %s: %s", room_id, exc)
 
         # If reconnecting with `since`, only send messages newer than that timestamp
         if since is not None:
             history = manager.get_messages_since(room_id, since)
-            logger.info(f"[WS] Reconnect recovery: sending {len(history)} messages since {since}")
+            # The history cap evicted messages newer than the cursor: fill the
+            # gap before the oldest in-memory message from Postgres.
+            _persistence = getattr(manager, "_persistence", None)
+            if _persistence and history and manager.has_evicted_history(room_id, newer_than=since):
+                pg_msgs = await _persistence.get_messages_before(room_id, history[0].ts, limit=MAX_ROOM_HISTORY)
+                history = [ChatMessage(**m) for m in pg_msgs if m["ts"] > since] + history
+            logger.info("[WS] Reconnect recovery: sending %d messages since %s", len(history), since)
 
         # Ensure room exists in Postgres (upsert) — skip for local mode
         # Local mode stores everything client-side; no Postgres dependency needed.
@@ -485,7 +565,7 @@ async def websocket_chat_endpoint(
                         owner_provider=sso_info.get("provider"),
                     )
                 except Exception as exc:
-                    logger.warning(f"[WS] ensure_room failed for {room_id}: {exc}")
+                    logger.warning("[WS] ensure_room failed for %s: %s", room_id, exc)
 
         # Send message history and user list to the newly connected client
         # For code_snippet messages, copy metadata → codeSnippet so the
@@ -508,16 +588,25 @@ async def websocket_chat_endpoint(
             }
         )
 
-        # Main message loop
+        # Registered user for this connection. Set on JOIN and reused by every
+        # later branch — the identity is fixed for the life of the socket.
+        bound_user: Optional[RoomUser] = None
+
+        # Main message loop — branch on the raw ASGI frame so a normal client
+        # close is handled without raising WebSocketDisconnect.
         while True:
-            data = await websocket.receive_json()
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                await _handle_client_disconnect(websocket, room_id)
+                break
+            data = json.loads(message["text"])
             message_type = data.get("type")
             logger.debug("[WS] Room %s received: type=%s", room_id, data.get("type", "?"))
 
             # --- Handle JOIN message (user registration) ---
             # SECURITY: Use backend-assigned userId and role, ignore client-provided values
             if message_type == "join":
-                logger.info(f"[WS] JOIN from backend-assigned userId={assigned_user_id}, role={assigned_role}")
+                logger.info("[WS] JOIN from backend-assigned userId=%s, role=%s", assigned_user_id, assigned_role)
                 sso_email = data.get("ssoEmail")
                 sso_provider = data.get("ssoProvider")
                 user_uuid = data.get("userUuid")  # Stable UUID from SSO/Postgres
@@ -544,7 +633,9 @@ async def websocket_chat_endpoint(
                             "leadId": manager.get_lead_id(room_id),
                         }
                     )
-                    logger.info(f"[WS] Using stable userUuid={assigned_user_id} (was temp={old_id}) in room {room_id}")
+                    logger.info(
+                        "[WS] Using stable userUuid=%s (was temp=%s) in room %s", assigned_user_id, old_id, room_id
+                    )
 
                 # Legacy identity reconciliation: if this SSO user was in the room
                 # before (no userUuid), reuse their original user_id to avoid duplicates.
@@ -568,7 +659,7 @@ async def websocket_chat_endpoint(
                                 "leadId": manager.get_lead_id(room_id),
                             }
                         )
-                        logger.info(f"[WS] Identity reclaimed via SSO for user {assigned_user_id} in room {room_id}")
+                        logger.info("[WS] Identity reclaimed via SSO for user %s in room %s", assigned_user_id, room_id)
 
                 user = manager.register_user(
                     websocket=websocket,
@@ -580,12 +671,13 @@ async def websocket_chat_endpoint(
                     sso_email=sso_email,
                     sso_provider=sso_provider,
                 )
+                bound_user = user
 
                 # SSO reconnect: elevate role if credentials match stored host identity.
                 role_restored = manager.try_restore_host_by_sso(room_id, assigned_user_id, sso_email, sso_provider)
                 if role_restored:
                     assigned_role = "host"
-                    logger.info(f"[WS] Host role restored via SSO for user {assigned_user_id} in room {room_id}")
+                    logger.info("[WS] Host role restored via SSO for user %s in room %s", assigned_user_id, room_id)
                     await websocket.send_json(
                         {
                             "type": "role_restored",
@@ -596,7 +688,7 @@ async def websocket_chat_endpoint(
 
                 # Broadcast updated user list to all clients
                 users_data = [u.model_dump() for u in manager.get_room_users(room_id)]
-                logger.info(f"[WS] Broadcasting user_joined. Total users: {len(users_data)}")
+                logger.info("[WS] Broadcasting user_joined. Total users: %d", len(users_data))
                 await manager.broadcast(
                     {"type": "user_joined", "user": user.model_dump(), "users": users_data}, room_id
                 )
@@ -615,7 +707,7 @@ async def websocket_chat_endpoint(
                             provider=sso_provider,
                         )
                     except Exception as exc:
-                        logger.warning(f"[WS] upsert_participant failed: {exc}")
+                        logger.warning("[WS] upsert_participant failed: %s", exc)
                 continue
 
             # --- Handle END_SESSION message (host only) ---
@@ -623,7 +715,7 @@ async def websocket_chat_endpoint(
             if message_type == "end_session":
                 # SECURITY: Use backend-assigned userId, not client-provided
                 if not manager.can_end_session(room_id, assigned_user_id):
-                    logger.warning(f"[WS] Unauthorized end_session attempt by userId={assigned_user_id}")
+                    logger.warning("[WS] Unauthorized end_session attempt by userId=%s", assigned_user_id)
                     await websocket.send_json({"type": "error", "error": "Only the host can end the session"})
                     continue
 
@@ -632,7 +724,7 @@ async def websocket_chat_endpoint(
 
                 blockers = check_end_chat_blockers(room_id)
                 if blockers:
-                    logger.info(f"[WS] end_session blocked for room {room_id}: {blockers}")
+                    logger.info("[WS] end_session blocked for room %s: %s", room_id, blockers)
                     await websocket.send_json(
                         {
                             "type": "end_session_blocked",
@@ -642,7 +734,7 @@ async def websocket_chat_endpoint(
                     )
                     continue
 
-                logger.info(f"[WS] Host {assigned_user_id} ending session for room {room_id}")
+                logger.info("[WS] Host %s ending session for room %s", assigned_user_id, room_id)
 
                 # Mark room as ended in Postgres (flush micro-batch buffer)
                 _persistence = getattr(manager, "_persistence", None)
@@ -650,15 +742,15 @@ async def websocket_chat_endpoint(
                     try:
                         await _persistence.end_room(room_id)
                     except Exception as exc:
-                        logger.error(f"[WS] end_room persistence failed for {room_id}: {exc}")
+                        logger.error("[WS] end_room persistence failed for %s: %s", room_id, exc)
 
                 # Delete all files for this room
                 try:
                     file_service = FileStorageService.get_instance()
                     deleted_count = await file_service.delete_room_files(room_id)
-                    logger.info(f"[WS] Deleted {deleted_count} files for room {room_id}")
+                    logger.info("[WS] Deleted %d files for room %s", deleted_count, room_id)
                 except Exception as e:
-                    logger.error(f"[WS] Failed to delete files for room {room_id}: {e}")
+                    logger.error("[WS] Failed to delete files for room %s: %s", room_id, e)
 
                 await manager.broadcast(
                     {"type": "session_ended", "message": "Host has ended the chat session"}, room_id
@@ -671,7 +763,7 @@ async def websocket_chat_endpoint(
             # --- Handle QUIT_CHAT message (any user) ---
             # Leave the room but preserve all data for later rejoin.
             if message_type == "quit_chat":
-                logger.info(f"[WS] User {assigned_user_id} quitting room {room_id} (data preserved)")
+                logger.info("[WS] User %s quitting room %s (data preserved)", assigned_user_id, room_id)
 
                 # Drain micro-batch buffer to Postgres
                 _persistence = getattr(manager, "_persistence", None)
@@ -679,7 +771,7 @@ async def websocket_chat_endpoint(
                     try:
                         await _persistence._flush_buffer(room_id)
                     except Exception as exc:
-                        logger.warning(f"[WS] quit_chat flush failed for {room_id}: {exc}")
+                        logger.warning("[WS] quit_chat flush failed for %s: %s", room_id, exc)
 
                 # Send confirmation before disconnecting
                 await websocket.send_json(
@@ -718,7 +810,7 @@ async def websocket_chat_endpoint(
             if message_type == "transfer_lead":
                 target_user_id = data.get("targetUserId")
                 if not manager.can_configure(room_id, assigned_user_id):
-                    logger.warning(f"[WS] Unauthorized transfer_lead attempt by userId={assigned_user_id}")
+                    logger.warning("[WS] Unauthorized transfer_lead attempt by userId=%s", assigned_user_id)
                     await websocket.send_json(
                         {"type": "error", "error": "Only the host or current lead can transfer lead"}
                     )
@@ -728,14 +820,14 @@ async def websocket_chat_endpoint(
                     await websocket.send_json({"type": "error", "error": "Invalid target user for lead transfer"})
                     continue
 
-                logger.info(f"[WS] Lead transferred to {target_user_id} in room {room_id}")
+                logger.info("[WS] Lead transferred to %s in room %s", target_user_id, room_id)
                 await manager.broadcast({"type": "lead_changed", "leadId": target_user_id}, room_id)
                 continue
 
             # --- Handle TYPING indicator message ---
             # SECURITY: Use backend-assigned userId
             if message_type == "typing":
-                user_info = manager.get_user(room_id, assigned_user_id)
+                user_info = bound_user
                 if user_info:
                     await manager.broadcast_except(
                         {
@@ -769,10 +861,10 @@ async def websocket_chat_endpoint(
 
                 # Deduplication check
                 if manager.is_duplicate_message(room_id, message_id):
-                    logger.debug(f"[WS] Duplicate file message ignored: {message_id}")
+                    logger.debug("[WS] Duplicate file message ignored: %s", message_id)
                     continue
 
-                user_info = manager.get_user(room_id, assigned_user_id)
+                user_info = bound_user
                 display_name = user_info.displayName if user_info else data.get("displayName", "")
                 identity_src = user_info.identitySource if user_info else "anonymous"
 
@@ -801,14 +893,14 @@ async def websocket_chat_endpoint(
 
                 broadcast_data = file_msg.model_dump()
                 broadcast_data.update(file_meta)
-                logger.info(f"[WS] Broadcasting file message: {file_meta.get('originalFilename')}")
+                logger.info("[WS] Broadcasting file message: %s", file_meta["originalFilename"])
                 await manager.broadcast(broadcast_data, room_id)
                 continue
 
             # --- Handle CODE SNIPPET message ---
             # SECURITY: Use backend-assigned userId and role
             if message_type == "code_snippet":
-                user_info = manager.get_user(room_id, assigned_user_id)
+                user_info = bound_user
                 display_name = user_info.displayName if user_info else data.get("displayName", "")
                 identity_src = user_info.identitySource if user_info else "anonymous"
                 cs = data.get("codeSnippet", {})
@@ -837,7 +929,10 @@ async def websocket_chat_endpoint(
                 broadcast_data = snippet_msg.model_dump()
                 broadcast_data["codeSnippet"] = snippet_meta
                 logger.info(
-                    f"[WS] Broadcasting code snippet: {snippet_meta.get('relativePath', 'unknown')} lines {snippet_meta.get('startLine')}-{snippet_meta.get('endLine')}"
+                    "[WS] Broadcasting code snippet: %s lines %s-%s",
+                    snippet_meta["relativePath"],
+                    snippet_meta["startLine"],
+                    snippet_meta["endLine"],
                 )
                 await manager.broadcast(broadcast_data, room_id)
                 continue
@@ -845,7 +940,7 @@ async def websocket_chat_endpoint(
             # --- Handle STACK TRACE message ---
             # SECURITY: Use backend-assigned userId and role
             if message_type == "stack_trace":
-                user_info = manager.get_user(room_id, assigned_user_id)
+                user_info = bound_user
                 display_name = user_info.displayName if user_info else data.get("displayName", "")
                 identity_src = user_info.identitySource if user_info else "anonymous"
 
@@ -867,8 +962,10 @@ async def websocket_chat_endpoint(
                 broadcast_data = trace_msg.model_dump()
                 broadcast_data["stackTrace"] = parsed
                 logger.info(
-                    f"[WS] Broadcasting stack_trace from {assigned_user_id}: "
-                    f"{parsed.get('errorType', 'unknown')} – {len(parsed.get('frames', []))} frames"
+                    "[WS] Broadcasting stack_trace from %s: %s – %d frames",
+                    assigned_user_id,
+                    parsed.get("errorType", "unknown"),
+                    len(parsed.get("frames", [])),
                 )
                 await manager.broadcast(broadcast_data, room_id)
                 continue
@@ -876,7 +973,7 @@ async def websocket_chat_endpoint(
             # --- Handle TEST FAILURE message ---
             # SECURITY: Use backend-assigned userId and role
             if message_type == "test_failure":
-                user_info = manager.get_user(room_id, assigned_user_id)
+                user_info = bound_user
                 display_name = user_info.displayName if user_info else data.get("displayName", "")
                 identity_src = user_info.identitySource if user_info else "anonymous"
 
@@ -898,8 +995,10 @@ async def websocket_chat_endpoint(
                 broadcast_data = fail_msg.model_dump()
                 broadcast_data["testFailure"] = test_failure
                 logger.info(
-                    f"[WS] Broadcasting test_failure from {assigned_user_id}: "
-                    f"{total_failed} failures ({test_failure.get('framework', 'unknown')} framework)"
+                    "[WS] Broadcasting test_failure from %s: %s failures (%s framework)",
+                    assigned_user_id,
+                    total_failed,
+                    test_failure.get("framework", "unknown"),
                 )
                 await manager.broadcast(broadcast_data, room_id)
                 continue
@@ -916,14 +1015,14 @@ async def websocket_chat_endpoint(
             content = data.get("content", "")
 
             # Validate: content is required and cannot be empty for regular messages
-            if not content or not content.strip():
+            if not content or content.isspace():
                 await websocket.send_json({"type": "error", "error": "Invalid message format: content is required"})
                 continue
 
-            logger.info(f"[WS] CHAT message from backend-assigned userId={assigned_user_id}: {content[:50]}")
+            logger.info("[WS] CHAT message from backend-assigned userId=%s: %.50s", assigned_user_id, content)
 
             # Use registered display name if available
-            user_info = manager.get_user(room_id, assigned_user_id)
+            user_info = bound_user
             display_name = user_info.displayName if user_info else data.get("displayName", "")
 
             # Create and store the full message
@@ -940,60 +1039,19 @@ async def websocket_chat_endpoint(
             await manager.add_message(room_id, full_message)
 
             # Broadcast to all clients in the room
-            logger.info(f"[WS] Broadcasting message to {manager.get_room_size(room_id)} connections")
+            logger.info("[WS] Broadcasting message to %d connections", manager.get_room_size(room_id))
             await manager.broadcast({"type": "message", **full_message.model_dump()}, room_id)
 
     except WebSocketDisconnect:
-        # Capture identity BEFORE disconnect() removes the websocket mapping.
-        pre_info = manager.websocket_to_user.get(websocket)
-        pre_user_id = pre_info[1] if pre_info else None
-        is_host_disconnect = pre_user_id is not None and manager.is_host(room_id, pre_user_id)
-        host_had_sso = room_id in manager.room_sso_hosts
-
-        disconnected_user, lead_reverted = manager.disconnect(websocket, room_id)
-
-        if disconnected_user:
-            # Track participant leaving in Postgres
-            _persistence = getattr(manager, "_persistence", None)
-            if _persistence and pre_user_id:
-                try:
-                    await _persistence.mark_participant_left(room_id, pre_user_id)
-                except Exception as exc:
-                    logger.warning(f"[WS] mark_participant_left failed: {exc}")
-
-            users_data = [u.model_dump() for u in manager.get_room_users(room_id)]
-            await manager.broadcast(
-                {"type": "user_left", "user": disconnected_user.model_dump(), "users": users_data}, room_id
-            )
-
-            # If lead reverted to host on disconnect, broadcast lead_changed
-            if lead_reverted:
-                new_lead_id = manager.get_lead_id(room_id)
-                logger.info(f"[WS] Lead reverted to host {new_lead_id} in room {room_id}")
-                await manager.broadcast({"type": "lead_changed", "leadId": new_lead_id}, room_id)
-
-        # Non-SSO host disconnect: purge history and audit logs.
-        if is_host_disconnect and not host_had_sso:
-            logger.info(f"[WS] Non-SSO host {pre_user_id} left room {room_id} — clearing history and audit logs")
-            await manager.clear_message_history(room_id)
-            try:
-                from app.audit.service import AuditLogService
-
-                await AuditLogService.get_instance().delete_room_logs(room_id)
-            except Exception as exc:
-                logger.error(f"[WS] Could not delete audit logs for room {room_id}: {exc}")
-            await manager.broadcast(
-                {
-                    "type": "history_cleared",
-                    "reason": "host_session_ended",
-                },
-                room_id,
-            )
+        # Unexpected close surfaced by a send/receive mid-handler
+        await _handle_client_disconnect(websocket, room_id)
 
     except Exception as exc:
         logger.exception(
-            f"[WS] Unhandled exception in websocket_chat_endpoint for room {room_id}, "
-            f"userId={assigned_user_id if 'assigned_user_id' in dir() else 'unassigned'}: {exc}"
+            "[WS] Unhandled exception in websocket_chat_endpoint for room %s, userId=%s: %s",
+            room_id,
+            assigned_user_id if "assigned_user_id" in dir() else "unassigned",
+            exc,
         )
         manager.disconnect(websocket, room_id)
         raise
@@ -28,7 +28,9 @@ Go:
 import re
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 # ---------------------------------------------------------------------------
 # Language enum
@@ -50,10 +52,12 @@ class StackTraceLanguage(str, Enum):
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StackFrame:
     """A single frame extracted from a stack trace.
 
+    Frozen so parsed frames can be shared between cached parse results.
+
     Attributes:
         raw: Original text of the frame line.
         file_path: Raw file path as it appears in the trace (may be absolute).
@@ -71,7 +75,12 @@ class StackFrame:
     is_internal: bool = False
 
 
-@dataclass
+# Serialized frame keys, paired positionally with the attributes read by _frame_values.
+_FRAME_KEYS = ("raw", "filePath", "lineNumber", "columnNumber", "functionName", "isInternal")
+_frame_values = attrgetter("raw", "file_path", "line_number", "column_number", "function_name", "is_internal")
+
+
+@dataclass(slots=True)
 class ParsedStackTrace:
     """A fully-parsed stack trace.
 
@@ -96,17 +105,7 @@ class ParsedStackTrace:
             "language": self.language.value,
             "errorType": self.error_type,
             "errorMessage": self.error_message,
-            "frames": [
-                {
-                    "raw": f.raw,
-                    "filePath": f.file_path,
-                    "lineNumber": f.line_number,
-                    "columnNumber": f.column_number,
-                    "functionName": f.function_name,
-                    "isInternal": f.is_internal,
-                }
-                for f in self.frames
-            ],
+            "frames": [dict(zip(_FRAME_KEYS, _frame_values(f))) for f in self.frames],
             "rawText": self.raw_text,
         }
 
@@ -115,25 +114,72 @@ class ParsedStackTrace:
 # Regex patterns
 # ---------------------------------------------------------------------------
 
+# Stack traces are pasted by users, so every pattern here runs on untrusted
+# text and has to stay linear in the line length.  A lazy group that scans
+# ahead is either the last one in its pattern or sits inside an atomic group
+# ``(?>...)``, and whitespace runs are matched possessively, so a line that
+# does not match is given up after one scan instead of being retried from
+# every split point.
+
+# Every separator str.splitlines() recognises.  The parsers fold them all to
+# "\n" first, so "line" means the same thing here as it did with splitlines().
+_LINE_BREAK = re.compile(r"\r\n?|[\v\f\x1c-\x1e\x85\u2028\u2029]")
+
+# Frame patterns run in multiline mode over the whole trace via finditer(), so
+# only matched frames are materialised.  Each is anchored at a line start and
+# uses [^\S\n] (whitespace other than a line break) rather than \s so a match
+# never spans lines; trailing ``.*`` extends the match to end of line so
+# ``group(0)`` is the raw frame.
+
 # Python:  File "path/to/file.py", line 42, in my_func
-_PY_FRAME = re.compile(r'\s*File\s+"([^"]+)",\s+line\s+(\d+),\s+in\s+(.+)')
+_PY_FRAME = re.compile(r'(?m)^[^\S\n]*+File[^\S\n]++"([^"\n]+)",[^\S\n]++line[^\S\n]++(\d+),[^\S\n]++in[^\S\n]+(.+)')
+
+# JS frames — one alternation tried in decreasing specificity, so a single
+# match per frame replaces four.  ``m.lastgroup`` names the variant:
+#   named:                  at MyFunc (/abs/path/file.ts:42:10)      -> "col"
+#   named without column:   at MyFunc (/abs/path/file.ts:42)         -> "line_nc"
+#   anonymous:              at /abs/path/file.ts:42:10               -> "anon_col"
+#   anonymous without col:  at /abs/path/file.ts:42                  -> "anon_line_nc"
+#   no function name:       at   (/abs/path/file.ts:42:10)           -> "bare_col" / "bare_line_nc"
+# A named frame's function ends at the first " (" on the line; the atomic
+# group keeps a failed path search from retrying at every later " (".
+_JS_FRAME = re.compile(
+    r"(?m)^[^\S\n]*+at[^\S\n]++(?>(?P<fn>.+?)(?<=\S)[^\S\n]++\()(?P<path>.+?):(?P<line>\d+):(?P<col>\d+)\).*"
+    r"|^[^\S\n]*+at(?=[^\S\n]{3})[^\S\n]++\((?P<bare_path>.+?):(?P<bare_line>\d+):(?P<bare_col>\d+)\).*"
+    r"|^[^\S\n]*+at[^\S\n]++(?>(?P<fn_nc>.+?)(?<=\S)[^\S\n]++\()(?P<path_nc>.+?):(?P<line_nc>\d+)\).*"
+    r"|^[^\S\n]*+at(?=[^\S\n]{3})[^\S\n]++\((?P<bare_path_nc>.+?):(?P<bare_line_nc>\d+)\).*"
+    r"|^[^\S\n]*+at[^\S\n]++(?P<anon_path>(?:/|[A-Za-z]:\\|\.\.?/|\w).+?):(?P<anon_line>\d+):(?P<anon_col>\d+)$"
+    r"|^[^\S\n]*+at[^\S\n]++(?P<anon_path_nc>(?:/|[A-Za-z]:\\|\.\.?/|\w).+?):(?P<anon_line_nc>\d+)$"
+)
 
-# JS named:     at MyFunc (/abs/path/file.ts:42:10)
-_JS_NAMED = re.compile(r"\s*at\s+(.+?)\s+\((.+?):(\d+):(\d+)\)")
-# JS named without column:  at MyFunc (/abs/path/file.ts:42)
-_JS_NAMED_NC = re.compile(r"\s*at\s+(.+?)\s+\((.+?):(\d+)\)")
-# JS anonymous:     at /abs/path/file.ts:42:10
-_JS_ANON = re.compile(r"\s*at\s+((?:\/|[A-Za-z]:\\|\.\.?\/|\w).+?):(\d+):(\d+)$")
-# JS anonymous without column:  at /abs/path/file.ts:42
-_JS_ANON_NC = re.compile(r"\s*at\s+((?:\/|[A-Za-z]:\\|\.\.?\/|\w).+?):(\d+)$")
+# Per-variant field extraction, keyed by ``m.lastgroup`` of a _JS_FRAME match:
+# (file_path, line, column, function_name).  Replaces an if/elif cascade.
+_JS_FIELDS: Dict[str, Callable[[Any], Tuple[str, str, Optional[str], Optional[str]]]] = {
+    "col": lambda m: (m["path"], m["line"], m["col"], m["fn"].strip()),
+    "bare_col": lambda m: (m["bare_path"], m["bare_line"], m["bare_col"], ""),
+    "line_nc": lambda m: (m["path_nc"], m["line_nc"], None, m["fn_nc"].strip()),
+    "bare_line_nc": lambda m: (m["bare_path_nc"], m["bare_line_nc"], None, ""),
+    "anon_col": lambda m: (m["anon_path"], m["anon_line"], m["anon_col"], None),
+    "anon_line_nc": lambda m: (m["anon_path_nc"], m["anon_line_nc"], None, None),
+}
 
 # Java:     at com.example.App.method(FileName.java:42)
-_JAVA_FRAME = re.compile(r"\s*at\s+([\w.$]+)\.([\w$<>[\]]+)\((.+?\.java):(\d+)\)")
+_JAVA_FRAME = re.compile(r"(?m)^[^\S\n]*+at[^\S\n]++([\w.$]+)\.([\w$<>[\]]+)\((.+?\.java):(\d+)\).*")
 
-# Go frame:   \t/path/to/file.go:42 +0x68
-_GO_FILE = re.compile(r"^\t(.+\.go):(\d+)(?:\s+\+0x[0-9a-f]+)?$")
-# Go function line (precedes file line):  main.process(...)
-_GO_FUNC = re.compile(r"^(\S+)\(")
+# Go — file lines and the function lines that precede them, in one pass:
+#   main.process(...)                  -> "func"
+#   \t/path/to/file.go:42 +0x68        -> "file", "line"
+_GO_FRAME = re.compile(r"(?m)^\t(?P<file>.+\.go):(?P<line>\d+)(?:[^\S\n]+\+0x[0-9a-f]+)?$|^(?!goroutine)[^\S\n]*+(?P<func>\S+)\(")
+
+# Language detection.  These search the raw text, so each is anchored to the
+# first candidate on a line (``^(?>.*?...)``): if that one cannot match, no
+# later one on the same line can either.
+_PY_DETECT = re.compile(r'(?m)^(?>.*?File ").+", line \d')
+_GO_DETECT = re.compile(r"(?m)^(?>.*?\t).+\.go:\d")
+_JAVA_DETECT = re.compile(r"\tat [\w.$]+\(\w+\.java:\d+\)")
+# "at", whitespace, then a ":N" or "(N" later on the same line — or, when the
+# whitespace runs over a line break, on the line where it ends.
+_JS_DETECT = re.compile(r"(?m)^(?>.*?at[^\S\n]).+?[:(]\d|at\s*\n.+?[:(]\d")
 
 
 # ---------------------------------------------------------------------------
@@ -155,10 +201,18 @@ _INTERNAL_INDICATORS = (
     "jdk/",
 )
 
+# One literal alternation scans the path once instead of once per indicator.
+_INTERNAL_RE = re.compile("|".join(map(re.escape, _INTERNAL_INDICATORS)))
+
 
+@lru_cache(maxsize=1024)
 def _is_internal(path: str) -> bool:
-    """Return True if the path looks like a standard-library or dependency file."""
-    return any(ind in path for ind in _INTERNAL_INDICATORS)
+    """Return True if the path looks like a standard-library or dependency file.
+
+    Memoised: a trace names the same few files over and over, so each
+    distinct path is classified once.
+    """
+    return _INTERNAL_RE.search(path) is not None
 
 
 # ---------------------------------------------------------------------------
@@ -168,16 +222,19 @@ def _is_internal(path: str) -> bool:
 
 def _detect_language(text: str) -> StackTraceLanguage:
     """Heuristically detect the language of a stack trace."""
-    if "Traceback (most recent call last)" in text or re.search(r'File ".+", line \d+', text):
+    # Checks run in priority order: Java and Python traces also contain lines
+    # the looser JS pattern accepts, so a leftmost-match alternation would
+    # misclassify them.
+    if "Traceback (most recent call last)" in text or _PY_DETECT.search(text):
         return StackTraceLanguage.PYTHON
 
-    if "goroutine" in text and re.search(r"\t.+\.go:\d+", text):
+    if "goroutine" in text and _GO_DETECT.search(text):
         return StackTraceLanguage.GO
 
-    if re.search(r"\tat [\w.$]+\([\w]+\.java:\d+\)", text):
+    if _JAVA_DETECT.search(text):
         return StackTraceLanguage.JAVA
 
-    if re.search(r"\n?\s*at\s+.+?[:(]\d+", text):
+    if _JS_DETECT.search(text):
         return StackTraceLanguage.JAVASCRIPT
 
     return StackTraceLanguage.UNKNOWN
@@ -188,26 +245,56 @@ def _detect_language(text: str) -> StackTraceLanguage:
 # ---------------------------------------------------------------------------
 
 
-def _parse_python(lines: List[str], result: ParsedStackTrace) -> None:
+def _iter_lines(text: str) -> Iterator[str]:
+    """Yield the lines of *text* front to back without splitting it up front.
+
+    Error-line lookups usually stop within the first few lines, so this
+    avoids materialising ``text.splitlines()`` for the whole trace.  *text*
+    has already had its line breaks folded to ``\\n`` (see ``_LINE_BREAK``).
+    """
+    start, end_of_text = 0, len(text)
+    while start < end_of_text:
+        end = text.find("\n", start)
+        if end == -1:
+            end = end_of_text
+        yield text[start:end]
+        start = end + 1
+
+
+def _iter_lines_reversed(text: str) -> Iterator[str]:
+    """Yield the lines of *text* back to front (see :func:`_iter_lines`)."""
+    end = len(text)
+    while end > 0:
+        start = text.rfind("\n", 0, end) + 1
+        yield text[start:end]
+        end = start - 1
+
+
+# Python lines that can never be the error line
+_PY_NON_ERROR_PREFIXES = ("File ", "Traceback", "During handling")
+
+
+def _parse_python(text: str, result: ParsedStackTrace) -> None:
     """Extract frames and error from a Python traceback."""
-    for line in lines:
-        m = _PY_FRAME.match(line)
-        if m:
-            file_path = m.group(1)
-            result.frames.append(
-                StackFrame(
-                    raw=line.rstrip(),
-                    file_path=file_path,
-                    line_number=int(m.group(2)),
-                    function_name=m.group(3).strip(),
-                    is_internal=_is_internal(file_path),
-                )
-            )
+    # Recursive traces repeat the same path / function name across many
+    # frames; keep one string object per distinct value.
+    shared: Dict[str, str] = {}
+    result.frames.extend(
+        StackFrame(
+            raw=m.group(0).rstrip(),
+            file_path=shared.setdefault(file_path, file_path),
+            line_number=int(line_no),
+            function_name=shared.setdefault(func, func).strip(),
+            is_internal=_is_internal(file_path),
+        )
+        for m in _PY_FRAME.finditer(text)
+        for file_path, line_no, func in (m.groups(),)
+    )
 
     # Error is the last non-blank, non-frame line
-    for line in reversed(lines):
+    for line in _iter_lines_reversed(text):
         s = line.strip()
-        if s and not s.startswith("File ") and not s.startswith("Traceback") and not s.startswith("During handling"):
+        if s and not s.startswith(_PY_NON_ERROR_PREFIXES):
             if ":" in s:
                 etype, _, emsg = s.partition(":")
                 result.error_type = etype.strip()
@@ -217,67 +304,24 @@ def _parse_python(lines: List[str], result: ParsedStackTrace) -> None:
             break
 
 
-def _parse_javascript(lines: List[str], result: ParsedStackTrace) -> None:
+def _parse_javascript(text: str, result: ParsedStackTrace) -> None:
     """Extract frames and error from a Node.js / V8 stack trace."""
-    for line in lines:
-        # Try patterns in decreasing specificity
-        m = _JS_NAMED.match(line)
-        if m:
-            file_path = m.group(2)
-            result.frames.append(
-                StackFrame(
-                    raw=line.rstrip(),
-                    file_path=file_path,
-                    line_number=int(m.group(3)),
-                    column_number=int(m.group(4)),
-                    function_name=m.group(1).strip(),
-                    is_internal=_is_internal(file_path),
-                )
-            )
-            continue
-
-        m = _JS_NAMED_NC.match(line)
-        if m:
-            file_path = m.group(2)
-            result.frames.append(
-                StackFrame(
-                    raw=line.rstrip(),
-                    file_path=file_path,
-                    line_number=int(m.group(3)),
-                    function_name=m.group(1).strip(),
-                    is_internal=_is_internal(file_path),
-                )
-            )
-            continue
-
-        m = _JS_ANON.match(line)
-        if m:
-            file_path = m.group(1)
-            result.frames.append(
-                StackFrame(
-                    raw=line.rstrip(),
-                    file_path=file_path,
-                    line_number=int(m.group(2)),
-                    column_number=int(m.group(3)),
-                    is_internal=_is_internal(file_path),
-                )
-            )
-            continue
-
-        m = _JS_ANON_NC.match(line)
-        if m:
-            file_path = m.group(1)
-            result.frames.append(
-                StackFrame(
-                    raw=line.rstrip(),
-                    file_path=file_path,
-                    line_number=int(m.group(2)),
-                    is_internal=_is_internal(file_path),
-                )
+    shared: Dict[str, str] = {}
+    for m in _JS_FRAME.finditer(text):
+        file_path, line_no, col_no, func = _JS_FIELDS[m.lastgroup](m)  # type: ignore[index]  # always set
+        result.frames.append(
+            StackFrame(
+                raw=m.group(0).rstrip(),
+                file_path=shared.setdefault(file_path, file_path),
+                line_number=int(line_no),
+                column_number=int(col_no) if col_no else None,
+                function_name=shared.setdefault(func, func) if func is not None else None,
+                is_internal=_is_internal(file_path),
             )
+        )
 
     # Error type is typically the very first line
-    for line in lines:
+    for line in _iter_lines(text):
         s = line.strip()
         if s and not s.startswith("at "):
             if ":" in s:
@@ -287,26 +331,25 @@ def _parse_javascript(lines: List[str], result: ParsedStackTrace) -> None:
             break
 
 
-def _parse_java(lines: List[str], result: ParsedStackTrace) -> None:
+def _parse_java(text: str, result: ParsedStackTrace) -> None:
     """Extract frames and error from a Java stack trace."""
-    for line in lines:
-        m = _JAVA_FRAME.match(line)
-        if m:
-            class_path, method, _file_name, line_no = (m.group(1), m.group(2), m.group(3), int(m.group(4)))
-            # Convert com.example.App → com/example/App.java
-            guessed_path = class_path.replace(".", "/") + ".java"
-            result.frames.append(
-                StackFrame(
-                    raw=line.rstrip(),
-                    file_path=guessed_path,
-                    line_number=line_no,
-                    function_name=f"{class_path.split('.')[-1]}.{method}",
-                    is_internal=_is_internal(class_path),
-                )
-            )
+    # Convert com.example.App → com/example/App.java, once per distinct class
+    guessed_paths: Dict[str, str] = {}
+    result.frames.extend(
+        StackFrame(
+            raw=m.group(0).rstrip(),
+            file_path=guessed_paths.get(class_path)
+            or guessed_paths.setdefault(class_path, class_path.replace(".", "/") + ".java"),
+            line_number=int(line_no),
+            function_name=f"{class_path.rpartition('.')[2]}.{method}",
+            is_internal=_is_internal(class_path),
+        )
+        for m in _JAVA_FRAME.finditer(text)
+        for class_path, method, line_no in (m.group(1, 2, 4),)
+    )
 
     # Error: first line containing "Exception" or "Error"
-    for line in lines:
+    for line in _iter_lines(text):
         s = line.strip()
         if ("Exception" in s or "Error" in s) and not s.startswith("at "):
             if ":" in s:
@@ -319,32 +362,30 @@ def _parse_java(lines: List[str], result: ParsedStackTrace) -> None:
             break
 
 
-def _parse_go(lines: List[str], result: ParsedStackTrace) -> None:
+def _parse_go(text: str, result: ParsedStackTrace) -> None:
     """Extract frames and error from a Go panic / goroutine dump."""
     pending_func: Optional[str] = None
+    shared: Dict[str, str] = {}
 
-    for line in lines:
-        m = _GO_FILE.match(line)
-        if m:
-            file_path = m.group(1)
-            result.frames.append(
-                StackFrame(
-                    raw=line.rstrip(),
-                    file_path=file_path,
-                    line_number=int(m.group(2)),
-                    function_name=pending_func,
-                    is_internal=_is_internal(file_path),
-                )
-            )
-            pending_func = None
+    for m in _GO_FRAME.finditer(text):
+        if m.lastgroup == "func":
+            pending_func = shared.setdefault(m["func"], m["func"])
             continue
 
-        fm = _GO_FUNC.match(line.strip())
-        if fm and not line.startswith("goroutine"):
-            pending_func = fm.group(1)
+        file_path = m["file"]
+        result.frames.append(
+            StackFrame(
+                raw=m.group(0).rstrip(),
+                file_path=shared.setdefault(file_path, file_path),
+                line_number=int(m["line"]),
+                function_name=pending_func,
+                is_internal=_is_internal(file_path),
+            )
+        )
+        pending_func = None
 
     # panic: <message>  or  runtime error: <message>
-    for line in lines:
+    for line in _iter_lines(text):
         s = line.strip()
         if s.startswith("panic:"):
             result.error_type = "panic"
@@ -356,44 +397,84 @@ def _parse_go(lines: List[str], result: ParsedStackTrace) -> None:
             break
 
 
+_Parser = Callable[[str, ParsedStackTrace], None]
+
+# Fallback order when detection fails; the map serves the detected-language path.
+_DISPATCH: Tuple[Tuple[StackTraceLanguage, _Parser], ...] = (
+    (StackTraceLanguage.PYTHON, _parse_python),
+    (StackTraceLanguage.JAVASCRIPT, _parse_javascript),
+    (StackTraceLanguage.JAVA, _parse_java),
+    (StackTraceLanguage.GO, _parse_go),
+)
+_DISPATCH_MAP: Dict[StackTraceLanguage, _Parser] = dict(_DISPATCH)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
 
-def parse_stack_trace(text: str) -> ParsedStackTrace:
-    """Parse a raw stack trace string into a :class:`ParsedStackTrace`.
+# Pastes longer than this are parsed without memoisation, so the cache below
+# never pins more than 256 of these in memory.
+_MAX_CACHED_TRACE_CHARS = 64 * 1024
 
-    The language is auto-detected.  If detection fails, all parsers are tried
-    in sequence until one produces frames.
 
-    Args:
-        text: Raw stack trace text pasted by the user.
-
-    Returns:
-        A :class:`ParsedStackTrace` instance (frames may be empty if the
-        text is not a recognised stack trace format).
-    """
+def _parse(text: str) -> ParsedStackTrace:
+    """Detect the language of *text* and run the matching parser."""
     result = ParsedStackTrace(raw_text=text)
     result.language = _detect_language(text)
-    lines = text.splitlines()
-
-    dispatch = {
-        StackTraceLanguage.PYTHON: _parse_python,
-        StackTraceLanguage.JAVASCRIPT: _parse_javascript,
-        StackTraceLanguage.JAVA: _parse_java,
-        StackTraceLanguage.GO: _parse_go,
-    }
-
-    parser = dispatch.get(result.language)
+    lines = _LINE_BREAK.sub("\n", text)
+    parser = _DISPATCH_MAP.get(result.language)
     if parser:
         parser(lines, result)
     else:
         # Try all parsers, stop at first successful parse
-        for lang, fn in dispatch.items():
+        for lang, fn in _DISPATCH:
             fn(lines, result)
             if result.frames:
                 result.language = lang
                 break
 
     return result
+
+
+@lru_cache(maxsize=256)
+def _parse_cached(text: str) -> ParsedStackTrace:
+    """Parse *text*, memoised — users often resend the same trace in chat.
+
+    The returned object is shared between callers and must not be mutated;
+    :func:`parse_stack_trace` hands out copies.
+    """
+    return _parse(text)
+
+
+def clear_parse_cache() -> None:
+    """Forget memoised traces and paths, e.g. when a room's history is purged."""
+    _parse_cached.cache_clear()
+    _is_internal.cache_clear()
+
+
+def parse_stack_trace(text: str) -> ParsedStackTrace:
+    """Parse a raw stack trace string into a :class:`ParsedStackTrace`.
+
+    The language is auto-detected.  If detection fails, all parsers are tried
+    in sequence until one produces frames.
+
+    Args:
+        text: Raw stack trace text pasted by the user.
+
+    Returns:
+        A :class:`ParsedStackTrace` instance (frames may be empty if the
+        text is not a recognised stack trace format).
+    """
+    if len(text) > _MAX_CACHED_TRACE_CHARS:
+        return _parse(text)
+
+    cached = _parse_cached(text)
+    return ParsedStackTrace(
+        language=cached.language,
+        error_type=cached.error_type,
+        error_message=cached.error_message,
+        frames=list(cached.frames),
+        raw_text=text,
+    )
@@ -840,10 +840,11 @@ async def repair_output(
     """
     prompt = _REPAIR_PROMPT.format(answer=answer[:_MAX_REPAIR_INPUT_CHARS])
     try:
-        loop = asyncio.get_event_loop()
-        repaired = await loop.run_in_executor(
-            None,
-            lambda: provider.call_model(prompt=prompt, max_tokens=2048, assistant_prefix="["),
+        repaired = await asyncio.to_thread(
+            provider.call_model,
+            prompt=prompt,
+            max_tokens=2048,
+            assistant_prefix="[",
         )
         findings = parse_findings(repaired, agent_name, category, warn_on_empty=False)
         if findings:
@@ -17,6 +17,7 @@ registered separately and only available when the agent has write access.
 from __future__ import annotations
 
 import difflib
+import hashlib
 import logging
 import os
 import re
@@ -56,8 +57,6 @@ def clear_file_read_state() -> None:
 
 def _content_hash(content: str) -> str:
     """Fast content hash for staleness comparison."""
-    import hashlib
-
     return hashlib.md5(content.encode("utf-8", errors="replace")).hexdigest()
 
 
@@ -7,6 +7,7 @@ accepted and returned are **relative** to the workspace root.
 from __future__ import annotations
 
 import contextlib
+import datetime
 import fnmatch
 import json as _json
 import logging
@@ -444,8 +445,9 @@ def read_file(
 
     record_file_read(str(fp), text)
 
-    lines = text.split("\n")
-    total = len(lines)
+    # Count lines in C and split only as far as the returned window needs;
+    # most reads cover a few hundred lines of a much larger file.
+    total = text.count("\n") + 1
 
     # Max lines to return when no line range is specified.
     # Kept small to force the agent to use file_outline → targeted read_file.
@@ -454,10 +456,12 @@ def read_file(
     if start_line or end_line:
         s = (start_line or 1) - 1
         e = end_line or total
+        lines = text.split("\n", e) if s >= 0 and e >= 0 else text.split("\n")
         selected = lines[s:e]
         content = "\n".join(f"{s + i + 1:>4} | {line}" for i, line in enumerate(selected))
         truncated = e < total
     else:
+        lines = text.split("\n", _AUTO_TRUNCATE_LINES)
         if total > _AUTO_TRUNCATE_LINES:
             selected = lines[:_AUTO_TRUNCATE_LINES]
             content = "\n".join(f"{i + 1:>4} | {line}" for i, line in enumerate(selected))
@@ -2325,8 +2329,6 @@ def git_blame(
 
 def _parse_blame_porcelain(raw: str) -> List[Dict]:
     """Parse git blame --line-porcelain output into structured entries."""
-    import datetime as _dt
-
     entries: List[Dict] = []
     cur: Dict[str, Any] = {}
     final_line = 0
@@ -2352,7 +2354,7 @@ def _parse_blame_porcelain(raw: str) -> List[Dict]:
         elif line.startswith("author-time "):
             try:
                 ts = int(line[12:])
-                cur["date"] = _dt.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
+                cur["date"] = datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
             except (ValueError, OSError):
                 cur["date"] = line[12:]
         # Skip other metadata lines (committer, summary, filename, etc.)
@@ -38,13 +38,30 @@ Environment variable overrides:
 
 from __future__ import annotations
 
+import copy
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class _ConfigModel(BaseModel):
+    """Base for every config model: the pydantic-core schema is built on first
+    use instead of at import, so importing this module stays cheap for code
+    that never loads settings."""
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class _FrozenConfigModel(_ConfigModel):
+    """Config model that is never mutated after loading (credentials, model
+    definitions); assignment raises instead of silently diverging from YAML."""
+
+    model_config = ConfigDict(frozen=True)
 
 
 def _env(name: str, default: str = "") -> str:
@@ -123,25 +140,44 @@ def _find_config_file(filename: str) -> Optional[Path]:
       3. ../config/{filename}
       4. ~/.conductor/{filename}
     """
-    locations = [
-        Path.cwd() / "config" / filename,
-        Path.cwd() / filename,
-        Path.cwd().parent / "config" / filename,
-        Path.home() / ".conductor" / filename,
-    ]
-    for path in locations:
-        if path.exists():
+    cwd = Path.cwd()  # resolved per call: the process may chdir after import
+    for directory in (cwd / "config", cwd, cwd.parent / "config", Path.home() / ".conductor"):
+        path = directory / filename
+        if os.path.isfile(path):
             logger.debug("Found config file: %s", path)
             return path
     return None
 
 
+# libyaml-backed loader when PyYAML was built with it (same output as
+# yaml.safe_load, parsed in C); pure-Python SafeLoader otherwise.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=16)
+def _parse_yaml_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse the YAML file at *path*.
+
+    *mtime_ns* and *size* are not read here — they are part of the cache key,
+    so an edited file misses the cache and is parsed again.  The returned
+    dict is shared; callers must copy it before mutating.
+    """
+    # Hand libyaml the whole buffer (it detects UTF-8/16 itself) rather than
+    # a text stream it would pull through Python-level read() calls.
+    with open(path, "rb") as fh:
+        return yaml.load(fh.read(), Loader=_YAML_LOADER) or {}
+
+
 def _load_yaml(path: Optional[Path]) -> Dict[str, Any]:
-    if path is None or not path.exists():
+    try:
+        st = path.stat() if path is not None else None
+    except FileNotFoundError:
+        st = None
+    if st is None:
         logger.warning("Config file not found: %s", path)
         return {}
-    with path.open(encoding="utf-8") as fh:
-        return yaml.safe_load(fh) or {}
+    # Deep copy: load_settings / _apply_env_overrides mutate the result.
+    return copy.deepcopy(_parse_yaml_cached(str(path), st.st_mtime_ns, st.st_size))
 
 
 def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
@@ -189,36 +225,36 @@ def _load_yaml_with_local(filename: str) -> Dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
-class PostgresSecrets(BaseModel):
+class PostgresSecrets(_FrozenConfigModel):
     """Postgres credentials (from conductor.secrets.yaml)."""
 
     user: str = "conductor"
     password: str = "conductor"
 
 
-class RedisSecrets(BaseModel):
+class RedisSecrets(_FrozenConfigModel):
     """Redis credentials (from conductor.secrets.yaml)."""
 
     password: str = ""
 
 
-class DatabaseSecrets(BaseModel):
+class DatabaseSecrets(_FrozenConfigModel):
     url: Optional[str] = None
 
 
-class JWTSecrets(BaseModel):
+class JWTSecrets(_FrozenConfigModel):
     secret_key: str = "change-me-in-production"
     algorithm: str = "HS256"
 
 
-class LangfuseSecrets(BaseModel):
+class LangfuseSecrets(_FrozenConfigModel):
     """Langfuse API keys (from conductor.secrets.yaml)."""
 
     public_key: str = ""
     secret_key: str = ""
 
 
-class Secrets(BaseModel):
+class Secrets(_FrozenConfigModel):
     database: DatabaseSecrets = Field(default_factory=DatabaseSecrets)
     postgres: PostgresSecrets = Field(default_factory=PostgresSecrets)
     redis: RedisSecrets = Field(default_factory=RedisSecrets)
@@ -231,7 +267,7 @@ class Secrets(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class ServerSettings(BaseModel):
+class ServerSettings(_ConfigModel):
     host: str = "0.0.0.0"
     port: int = 8000
     debug: bool = False
@@ -244,14 +280,14 @@ class ServerSettings(BaseModel):
     public_url: str = ""
 
 
-class DatabaseSettings(BaseModel):
+class DatabaseSettings(_ConfigModel):
     pool_size: int = 10
     max_overflow: int = 20
     pool_timeout: int = 30
     echo_sql: bool = False
 
 
-class PostgresSettings(BaseModel):
+class PostgresSettings(_ConfigModel):
     """PostgreSQL connection settings (async via asyncpg).
 
     Credentials come from ``secrets.postgres`` in conductor.secrets.yaml.
@@ -266,7 +302,7 @@ class PostgresSettings(BaseModel):
     max_overflow: int = 20
 
 
-class RedisSettings(BaseModel):
+class RedisSettings(_ConfigModel):
     """Redis connection settings.
 
     Password comes from ``secrets.redis`` in conductor.secrets.yaml.
@@ -280,20 +316,20 @@ class RedisSettings(BaseModel):
     prefix: str = "conductor:"
 
 
-class AuthSettings(BaseModel):
+class AuthSettings(_ConfigModel):
     token_expire_minutes: int = 60
     refresh_expire_days: int = 7
     require_email_verify: bool = False
 
 
-class RoomSettings(BaseModel):
+class RoomSettings(_ConfigModel):
     max_participants: int = 50
     max_rooms_per_user: int = 10
     session_timeout_minutes: int = 120
     enable_persistence: bool = True
 
 
-class GitWorkspaceSettings(BaseModel):
+class GitWorkspaceSettings(_ConfigModel):
     """Configuration for the Git Workspace module."""
 
     enabled: bool = True
@@ -304,7 +340,7 @@ class GitWorkspaceSettings(BaseModel):
     cleanup_on_room_close: bool = True
 
 
-class TraceSettings(BaseModel):
+class TraceSettings(_ConfigModel):
     """Configuration for agent loop session tracing.
 
     Traces record per-iteration metrics (tokens, latencies, tool calls)
@@ -321,7 +357,7 @@ class TraceSettings(BaseModel):
     database_url: str = ""  # e.g. "sqlite:///traces.db" or "postgresql://..."
 
 
-class LangfuseSettings(BaseModel):
+class LangfuseSettings(_ConfigModel):
     """Configuration for Langfuse observability integration.
 
     Self-hosted via docker/docker-compose.langfuse.yaml.
@@ -332,7 +368,7 @@ class LangfuseSettings(BaseModel):
     host: str = "http://localhost:3001"
 
 
-class CodeSearchSettings(BaseModel):
+class CodeSearchSettings(_ConfigModel):
     """Configuration for code search and repo graph features."""
 
     # -- RepoMap (graph-based context) --
@@ -340,7 +376,7 @@ class CodeSearchSettings(BaseModel):
     repo_map_top_n: int = 10  # Top N files by PageRank to include in map
 
 
-class AppSettings(BaseModel):
+class AppSettings(_ConfigModel):
     server: ServerSettings = Field(default_factory=ServerSettings)
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
     postgres: PostgresSettings = Field(default_factory=PostgresSettings)
@@ -404,20 +440,20 @@ def load_settings() -> AppSettings:
 # ---------------------------------------------------------------------------
 
 
-class SummaryConfig(BaseModel):
+class SummaryConfig(_ConfigModel):
     """Configuration for AI summarization feature."""
 
     enabled: bool = False
     default_model: str = "claude-3-haiku-bedrock"
 
 
-class AnthropicSecretsConfig(BaseModel):
+class AnthropicSecretsConfig(_FrozenConfigModel):
     """Anthropic API credentials."""
 
     api_key: str = ""
 
 
-class AWSBedrockSecretsConfig(BaseModel):
+class AWSBedrockSecretsConfig(_FrozenConfigModel):
     """AWS Bedrock credentials."""
 
     access_key_id: str = ""
@@ -426,14 +462,14 @@ class AWSBedrockSecretsConfig(BaseModel):
     region: str = "us-east-1"
 
 
-class OpenAISecretsConfig(BaseModel):
+class OpenAISecretsConfig(_FrozenConfigModel):
     """OpenAI API credentials."""
 
     api_key: str = ""
     organization: Optional[str] = None
 
 
-class AlibabaSecretsConfig(BaseModel):
+class AlibabaSecretsConfig(_FrozenConfigModel):
     """Alibaba Cloud DashScope API credentials.
 
     Uses an OpenAI-compatible endpoint at DashScope.
@@ -444,7 +480,7 @@ class AlibabaSecretsConfig(BaseModel):
     base_url: str = "https://dashscope-intl.aliyuncs.com/compatible-mode/v1"
 
 
-class MoonshotSecretsConfig(BaseModel):
+class MoonshotSecretsConfig(_FrozenConfigModel):
     """Moonshot AI (Kimi) API credentials.
 
     Uses an OpenAI-compatible endpoint.
@@ -455,7 +491,7 @@ class MoonshotSecretsConfig(BaseModel):
     base_url: str = "https://api.moonshot.ai/v1"
 
 
-class AIProvidersSecretsConfig(BaseModel):
+class AIProvidersSecretsConfig(_FrozenConfigModel):
     """Credentials for all AI providers."""
 
     anthropic: AnthropicSecretsConfig = Field(default_factory=AnthropicSecretsConfig)
@@ -465,7 +501,7 @@ class AIProvidersSecretsConfig(BaseModel):
     moonshot: MoonshotSecretsConfig = Field(default_factory=MoonshotSecretsConfig)
 
 
-class AIProviderSettingsConfig(BaseModel):
+class AIProviderSettingsConfig(_ConfigModel):
     """Enable/disable flags for each AI provider."""
 
     anthropic_enabled: bool = False
@@ -475,7 +511,7 @@ class AIProviderSettingsConfig(BaseModel):
     moonshot_enabled: bool = False
 
 
-class AIModelConfig(BaseModel):
+class AIModelConfig(_FrozenConfigModel):
     """Configuration for a single AI model.
 
     Flags:
@@ -498,7 +534,7 @@ class AIModelConfig(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class SSOConfig(BaseModel):
+class SSOConfig(_ConfigModel):
     """AWS SSO configuration."""
 
     enabled: bool = False
@@ -506,34 +542,34 @@ class SSOConfig(BaseModel):
     region: str = "us-east-1"
 
 
-class GoogleSSOConfig(BaseModel):
+class GoogleSSOConfig(_ConfigModel):
     """Google OAuth SSO configuration."""
 
     enabled: bool = False
 
 
-class GoogleSSOSecretsConfig(BaseModel):
+class GoogleSSOSecretsConfig(_FrozenConfigModel):
     """Google OAuth credentials."""
 
     client_id: str = ""
     client_secret: str = ""
 
 
-class JiraTeamEntry(BaseModel):
+class JiraTeamEntry(_ConfigModel):
     """A statically configured Atlassian team (UUID + display name)."""
 
     id: str
     name: str
 
 
-class JiraBranchFormats(BaseModel):
+class JiraBranchFormats(_ConfigModel):
     """Branch naming templates for ticket-linked branches."""
 
     feature: str = "feature/{ticket}-{content}"
     bugfix: str = "bugfix/{ticket}-{content}"
 
 
-class JiraSettings(BaseModel):
+class JiraSettings(_ConfigModel):
     """Jira integration configuration."""
 
     enabled: bool = False
@@ -542,14 +578,14 @@ class JiraSettings(BaseModel):
     teams: List[JiraTeamEntry] = []
 
 
-class JiraSecretsConfig(BaseModel):
+class JiraSecretsConfig(_FrozenConfigModel):
     """Jira OAuth credentials (from conductor.secrets.yaml)."""
 
     client_id: str = ""
     client_secret: str = ""
 
 
-class AtlassianReadonlySecretsConfig(BaseModel):
+class AtlassianReadonlySecretsConfig(_FrozenConfigModel):
     """Atlassian API token credentials (Basic auth, read-only) — shared Jira + Confluence.
 
     Classic (non-scoped) API tokens are account-level, so one token serves both
@@ -569,7 +605,7 @@ class AtlassianReadonlySecretsConfig(BaseModel):
     webhook_token: str = ""
 
 
-class TeamsSettings(BaseModel):
+class TeamsSettings(_ConfigModel):
     """Microsoft Teams bot integration toggle (from conductor.settings.yaml).
 
     All real credentials live in :class:`TeamsSecretsConfig`; this section only
@@ -580,7 +616,7 @@ class TeamsSettings(BaseModel):
     enabled: bool = False
 
 
-class TeamsSecretsConfig(BaseModel):
+class TeamsSecretsConfig(_FrozenConfigModel):
     """Microsoft Teams / Bot Framework credentials (from conductor.secrets.yaml).
 
     Field names mirror Microsoft's ``botbuilder-core`` SDK env var convention
@@ -605,7 +641,7 @@ class TeamsSecretsConfig(BaseModel):
     app_type: str = "SingleTenant"
 
 
-class AzureDevOpsSettings(BaseModel):
+class AzureDevOpsSettings(_ConfigModel):
     """Azure DevOps integration configuration."""
 
     enabled: bool = False
@@ -614,7 +650,7 @@ class AzureDevOpsSettings(BaseModel):
     workspace_path: str = ""  # auto-resolved if empty: ~/.conductor/azure_workspaces/{repo_name}
 
 
-class AzureDevOpsSecretsConfig(BaseModel):
+class AzureDevOpsSecretsConfig(_FrozenConfigModel):
     """Azure DevOps credentials (from conductor.secrets.yaml)."""
 
     org_url: str = ""  # e.g. https://dev.azure.com/myorg
@@ -626,7 +662,7 @@ class AzureDevOpsSecretsConfig(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class LoggingConfig(BaseModel):
+class LoggingConfig(_ConfigModel):
     """Logging and audit configuration."""
 
     audit_enabled: bool = False
@@ -638,19 +674,19 @@ class LoggingConfig(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class PromptConfig(BaseModel):
+class PromptConfig(_ConfigModel):
     """Prompt rendering options."""
 
     output_mode: str = "unified_diff"
 
 
-class AutoApplyLimitsConfig(BaseModel):
+class AutoApplyLimitsConfig(_ConfigModel):
     """Limits applied specifically to auto-apply mode."""
 
     max_lines: int = 50
 
 
-class ChangeLimitsConfig(BaseModel):
+class ChangeLimitsConfig(_ConfigModel):
     """Limits on the size of AI-generated changesets."""
 
     max_files_per_request: int = 2
@@ -663,13 +699,13 @@ class ChangeLimitsConfig(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class SessionConfig(BaseModel):
+class SessionConfig(_ConfigModel):
     """Session / room participation limits."""
 
     max_participants: int = 50
 
 
-class ConductorConfig(BaseModel):
+class ConductorConfig(_ConfigModel):
     """Unified top-level configuration used by newer modules."""
 
     summary: SummaryConfig = Field(default_factory=SummaryConfig)
@@ -884,7 +920,9 @@ def load_config(
     ai_models_raw = raw.get("ai_models", [])
     ai_models_cfg = [AIModelConfig(**m) for m in ai_models_raw]
 
-    return ConductorConfig(
+    # Every field below is already a validated sub-model built above, so skip
+    # re-validating the top-level container (unset fields still get defaults).
+    return ConductorConfig.model_construct(
         summary=summary_cfg,
         ai_providers=ai_providers_cfg,
         ai_provider_settings=ai_provider_settings_cfg,
@@ -925,6 +963,7 @@ def get_config() -> ConductorConfig:
 
 
 def reset_config() -> None:
-    """Clear the cached :class:`ConductorConfig` singleton (for use in tests)."""
+    """Clear the cached :class:`ConductorConfig` singleton and parsed YAML (for use in tests)."""
     global _conductor_config
     _conductor_config = None
+    _parse_yaml_cached.cache_clear()
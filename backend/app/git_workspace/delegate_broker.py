@@ -118,7 +118,7 @@ class DelegateBroker:
             operation=operation,
         )
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         fut: asyncio.Future = loop.create_future()  # type: ignore[type-arg]
         self._pending[request_id] = fut
 
@@ -21,6 +21,7 @@ Brain → return a real investigation plan with file:line evidence.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, Optional
 
@@ -169,7 +170,10 @@ async def investigate_and_comment(
         project_guide_excerpt=project_excerpt,
     )
 
-    triage_text = provider.call_model(
+    # call_model is a blocking SDK call; keep it off the event loop so the
+    # rest of the app keeps serving requests while the model responds.
+    raw_triage = await asyncio.to_thread(
+        provider.call_model,
         prompt=prompt,
         max_tokens=1200,
         system=(
@@ -178,7 +182,8 @@ async def investigate_and_comment(
             "NOT speculate — if the ticket lacks detail, say so."
         ),
         temperature=0.3,
-    ).strip()
+    )
+    triage_text = raw_triage.strip()
 
     if not triage_text:
         logger.warning("[Jira webhook] empty triage text for %s — skipping comment", issue_key)
@@ -604,8 +604,6 @@ def create_app(settings: AppSettings | None = None) -> FastAPI:
         return {"status": "ok"}
 
     # --- Public URL ---
-    _settings_for_public_url = settings or load_settings()
-
     @app.get("/public-url", include_in_schema=True)
     async def public_url() -> dict:
         """Return the public URL so the extension can build correct invite
@@ -615,7 +613,7 @@ def create_app(settings: AppSettings | None = None) -> FastAPI:
         if live_url:
             return {"public_url": live_url}
         # Fall back to the static value from conductor.settings.yaml
-        url = (_settings_for_public_url.server.public_url or "").strip()
+        url = (_s.server.public_url or "").strip()
         return {"public_url": url}
 
     # --- Prometheus-compatible metrics scrape endpoint ---
@@ -629,6 +629,12 @@ class TestExtractToolCallsFromText:
         assert len(calls) == 1
         assert calls[0].name == "find_symbol"
 
+    def test_json_with_braces_inside_string_values(self):
+        text = 'Searching: {"name": "grep", "arguments": {"pattern": "if (x) {", "path": "src"}} done }'
+        calls = _extract_tool_calls_from_text(text, KNOWN_TOOLS)
+        assert len(calls) == 1
+        assert calls[0].input == {"pattern": "if (x) {", "path": "src"}
+
     def test_unknown_tool_in_json_ignored(self):
         text = '{"name": "unknown_tool", "arguments": {"x": 1}}'
         calls = _extract_tool_calls_from_text(text, KNOWN_TOOLS)
@@ -6,11 +6,13 @@ SECURITY NOTE: The WebSocket protocol now implements server-side credential assi
 3. All messages use backend-assigned userId and role
 """
 
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 from fastapi.testclient import TestClient
 
 from app.audit.service import AuditLogService
-from app.chat.manager import manager
+from app.chat.manager import MAX_ROOM_HISTORY, ChatMessage, manager
 from app.main import app
 
 client = TestClient(app)
@@ -903,6 +905,25 @@ def test_non_sso_host_disconnect_clears_history():
     assert room_id not in manager.room_sso_hosts
 
 
+def test_non_sso_host_disconnect_forgets_parsed_stack_traces():
+    """The non-SSO purge also drops memoised stack trace parses."""
+    from app.chat.stack_trace_parser import _parse_cached, parse_stack_trace
+
+    room_id = "test-non-sso-traces"
+
+    with client.websocket_connect(f"/ws/chat/{room_id}") as ws1:
+        receive_credentials(ws1)
+        receive_history(ws1)
+
+        ws1.send_json({"type": "join", "displayName": "Host", "identitySource": "named"})
+        ws1.receive_json()
+
+        parse_stack_trace('Traceback (most recent call last):\n  File "a.py", line 1, in f\nValueError: x\n')
+        assert _parse_cached.cache_info().currsize > 0
+
+    assert _parse_cached.cache_info().currsize == 0
+
+
 def test_sso_host_disconnect_preserves_history():
     """When an SSO-authenticated host disconnects, message history is NOT cleared."""
     room_id = "test-sso-preserve"
@@ -937,3 +958,143 @@ def test_sso_host_disconnect_preserves_history():
 
     # After host disconnects, history must still be intact for the remaining guest.
     assert manager.get_message_count(room_id) == 1
+
+
+class TestHistoryPagination:
+    """In-memory history lookups (since/before cursors) and the per-room cap."""
+
+    @staticmethod
+    def _seed(room_id, timestamps):
+        manager.message_history[room_id] = [
+            ChatMessage(roomId=room_id, userId="u1", displayName="U", role="host", content=str(ts), ts=ts)
+            for ts in timestamps
+        ]
+
+    def test_messages_since_excludes_cursor(self):
+        self._seed("test-since", [1.0, 2.0, 3.0, 4.0])
+        assert [m.ts for m in manager.get_messages_since("test-since", 2.0)] == [3.0, 4.0]
+        assert [m.ts for m in manager.get_messages_since("test-since", 0.5)] == [1.0, 2.0, 3.0, 4.0]
+        assert manager.get_messages_since("test-since", 4.0) == []
+        assert manager.get_messages_since("unknown-room", 0.0) == []
+
+    def test_paginated_history_before_cursor(self):
+        self._seed("test-page", [1.0, 2.0, 3.0, 4.0, 5.0])
+        assert [m.ts for m in manager.get_paginated_history("test-page", None, 2)] == [4.0, 5.0]
+        assert [m.ts for m in manager.get_paginated_history("test-page", 4.0, 2)] == [2.0, 3.0]
+        assert [m.ts for m in manager.get_paginated_history("test-page", 2.5, 10)] == [1.0, 2.0]
+        assert manager.get_paginated_history("test-page", 1.0, 10) == []
+
+    @pytest.mark.asyncio
+    async def test_history_capped_per_room(self, monkeypatch):
+        import app.chat.manager as manager_module
+
+        monkeypatch.setattr(manager_module, "MAX_ROOM_HISTORY", 3)
+        monkeypatch.setattr(manager, "_is_local_room", lambda _room_id: True)
+        monkeypatch.setattr(manager, "history_evicted_ts", {})
+        room_id = "test-history-cap"
+        for ts in (1.0, 2.0, 3.0, 4.0, 5.0):
+            msg = ChatMessage(roomId=room_id, userId="u1", displayName="U", role="host", content="x", ts=ts)
+            await manager.add_message(room_id, msg)
+
+        assert [m.ts for m in manager.get_history(room_id)] == [3.0, 4.0, 5.0]
+        assert manager.has_evicted_history(room_id)
+        assert manager.has_evicted_history(room_id, newer_than=1.5)
+        assert not manager.has_evicted_history(room_id, newer_than=2.0)
+
+        await manager.clear_message_history(room_id)
+        assert not manager.has_evicted_history(room_id)
+
+    def test_load_history_applies_cap(self, monkeypatch):
+        import app.chat.manager as manager_module
+
+        monkeypatch.setattr(manager_module, "MAX_ROOM_HISTORY", 3)
+        monkeypatch.setattr(manager, "history_evicted_ts", {})
+        room_id = "test-load-cap"
+        manager.message_history.pop(room_id, None)
+        hydrated = [
+            ChatMessage(roomId=room_id, userId="u1", displayName="U", role="host", content="x", ts=ts)
+            for ts in (1.0, 2.0, 3.0, 4.0, 5.0)
+        ]
+
+        assert [m.ts for m in manager.load_history(room_id, hydrated)] == [3.0, 4.0, 5.0]
+        assert manager.history_evicted_ts[room_id] == 2.0
+
+    @staticmethod
+    def _fake_persistence(monkeypatch):
+        persistence = MagicMock()
+        monkeypatch.setattr(app.state, "chat_persistence", persistence, raising=False)
+        return persistence
+
+    def test_messages_since_past_eviction_reads_postgres(self, monkeypatch):
+        room_id = "test-since-evicted"
+        self._seed(room_id, [3.0, 4.0])
+        monkeypatch.setitem(manager.history_evicted_ts, room_id, 2.0)
+        persistence = self._fake_persistence(monkeypatch)
+        persistence.get_messages_since = AsyncMock(return_value=[{"id": "pg", "ts": ts} for ts in (2.0, 3.0, 4.0)])
+
+        data = client.get(f"/chat/{room_id}/messages/since", params={"since": 1.0}).json()
+        assert data["source"] == "postgres"
+        assert [m["ts"] for m in data["messages"]] == [2.0, 3.0, 4.0]
+
+        # A cursor inside the retained history is served from memory
+        data = client.get(f"/chat/{room_id}/messages/since", params={"since": 3.0}).json()
+        assert data["source"] == "memory"
+        assert [m["ts"] for m in data["messages"]] == [4.0]
+
+        # Nothing persisted (e.g. local-mode room): keep what memory has
+        persistence.get_messages_since.return_value = []
+        data = client.get(f"/chat/{room_id}/messages/since", params={"since": 1.0}).json()
+        assert data["source"] == "memory"
+        assert [m["ts"] for m in data["messages"]] == [3.0, 4.0]
+
+    def test_history_page_past_eviction_reads_postgres(self, monkeypatch):
+        room_id = "test-page-evicted"
+        self._seed(room_id, [3.0, 4.0, 5.0])
+        monkeypatch.setitem(manager.history_evicted_ts, room_id, 2.0)
+        persistence = self._fake_persistence(monkeypatch)
+        persistence.get_messages_before = AsyncMock(
+            return_value=[{"id": "pg", "ts": ts} for ts in (1.0, 2.0, 3.0, 4.0)]
+        )
+
+        # A full page ending at the oldest in-memory message still has more
+        data = client.get(f"/chat/{room_id}/history", params={"limit": 3}).json()
+        assert [m["ts"] for m in data["messages"]] == [3.0, 4.0, 5.0]
+        assert data["hasMore"] is True
+        persistence.get_messages_before.assert_not_awaited()
+
+        # A page running past it continues in Postgres
+        data = client.get(f"/chat/{room_id}/history", params={"before": 5.0, "limit": 3}).json()
+        assert [m["ts"] for m in data["messages"]] == [2.0, 3.0, 4.0]
+        assert data["hasMore"] is True
+        persistence.get_messages_before.assert_awaited_once_with(room_id, 5.0, limit=4)
+
+    def test_reconnect_past_eviction_fills_gap_from_postgres(self, monkeypatch):
+        room_id = "test-ws-evicted"
+        self._seed(room_id, [3.0, 4.0])
+        monkeypatch.setitem(manager.history_evicted_ts, room_id, 2.0)
+        persistence = MagicMock()
+        persistence.ensure_room = AsyncMock()
+        persistence.get_messages_before = AsyncMock(
+            return_value=[
+                {"roomId": room_id, "userId": "u1", "displayName": "U", "role": "host", "content": "x", "ts": ts}
+                for ts in (1.0, 2.0)
+            ]
+        )
+        monkeypatch.setattr(manager, "_persistence", persistence)
+
+        with client.websocket_connect(f"/ws/chat/{room_id}?since=1.5") as ws:
+            receive_credentials(ws)
+            history = ws.receive_json()
+
+        assert history["isRecovery"] is True
+        assert [m["ts"] for m in history["messages"]] == [2.0, 3.0, 4.0]
+        persistence.get_messages_before.assert_awaited_once_with(room_id, 3.0, limit=MAX_ROOM_HISTORY)
+
+    def test_messages_after_returns_newer_messages(self):
+        room_id = "test-after"
+        self._seed(room_id, [1.0, 2.0, 3.0, 4.0])
+        last_id = manager.get_history(room_id)[1].id
+
+        data = client.get(f"/chat/{room_id}/messages/after", params={"last_id": last_id, "limit": 1}).json()
+        assert data["source"] == "memory"
+        assert [m["ts"] for m in data["messages"]] == [3.0]
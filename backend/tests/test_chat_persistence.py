@@ -199,6 +199,22 @@ class TestReadPath:
         assert len(msgs) == 2
         assert msgs[0]["ts"] == 1003.0
 
+    @pytest.mark.asyncio
+    async def test_get_messages_before(self, persistence):
+        room = "room-before"
+        await persistence.ensure_room(room)
+        for i in range(5):
+            await persistence.enqueue_message(room, _msg(room, i))
+        await asyncio.sleep(0.2)
+        await persistence._flush_buffer(room)
+
+        # Newest two messages before ts=1003 (idx 1 and 2), oldest first
+        msgs = await persistence.get_messages_before(room, 1003.0, limit=2)
+        assert [m["ts"] for m in msgs] == [1001.0, 1002.0]
+        # No cursor: the newest messages of the room
+        msgs = await persistence.get_messages_before(room, None, limit=2)
+        assert [m["ts"] for m in msgs] == [1003.0, 1004.0]
+
     @pytest.mark.asyncio
     async def test_hydrate_room_from_postgres(self, persistence):
         """hydrate_room should load from Postgres when Redis is unavailable."""
@@ -368,6 +368,45 @@ class TestReadFile:
         assert result.success
         assert "   1 |" in result.data["content"]
 
+    def test_default_window_is_first_200_lines(self, workspace):
+        (workspace / "long.py").write_text("".join(f"line {i}\n" for i in range(1, 251)))
+        result = read_file(str(workspace), "long.py")
+        assert result.success
+        assert result.truncated
+        assert result.data["total_lines"] == 251
+        content = result.data["content"]
+        assert " 200 | line 200\n" in content
+        assert " 201 |" not in content
+        assert "(showing first 200 of 251 lines)" in content
+
+    def test_end_line_past_eof(self, workspace):
+        (workspace / "short.py").write_text("a\nb\nc\nd\ne\n")
+        result = read_file(str(workspace), "short.py", start_line=4, end_line=50)
+        assert result.success
+        assert not result.truncated
+        assert result.data["total_lines"] == 6
+        assert result.data["content"] == "   4 | d\n   5 | e\n   6 | "
+
+    def test_file_without_trailing_newline(self, workspace):
+        (workspace / "notrail.py").write_text("a\nb\nc")
+        result = read_file(str(workspace), "notrail.py")
+        assert result.data["total_lines"] == 3
+        assert result.data["content"] == "   1 | a\n   2 | b\n   3 | c"
+
+        ranged = read_file(str(workspace), "notrail.py", start_line=2, end_line=3)
+        assert ranged.data["content"] == "   2 | b\n   3 | c"
+        assert not ranged.truncated
+
+    def test_crlf_line_endings(self, workspace):
+        (workspace / "crlf.py").write_bytes(b"a\r\nb\r\nc\r\n")
+        result = read_file(str(workspace), "crlf.py")
+        assert result.data["total_lines"] == 4
+        assert result.data["content"] == "   1 | a\n   2 | b\n   3 | c\n   4 | "
+
+        ranged = read_file(str(workspace), "crlf.py", start_line=1, end_line=2)
+        assert ranged.data["content"] == "   1 | a\n   2 | b"
+        assert ranged.truncated
+
 
 # ---------------------------------------------------------------------------
 # list_files
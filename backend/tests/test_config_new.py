@@ -15,7 +15,9 @@ import sys
 import types
 from unittest.mock import MagicMock, patch
 
+import pytest
 import yaml
+from pydantic import ValidationError
 
 # ---------------------------------------------------------------------------
 # Stubs
@@ -45,6 +47,7 @@ from app.config import (
     JWTSecrets,
     Secrets,
     _find_config_file,
+    _load_yaml,
     load_settings,
 )
 
@@ -97,6 +100,14 @@ class TestFindConfigFile:
         monkeypatch.chdir(tmp_path)
         assert _find_config_file("conductor.settings.yaml") is None
 
+    def test_skips_directory_with_config_name(self, tmp_path, monkeypatch):
+        """Only regular files match; a directory of the same name is ignored."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "config" / "conductor.settings.yaml").mkdir(parents=True)
+        target = tmp_path / "conductor.settings.yaml"
+        target.write_text("server: {}")
+        assert _find_config_file("conductor.settings.yaml") == target
+
     def test_finds_secrets_file(self, tmp_path, monkeypatch):
         monkeypatch.chdir(tmp_path)
         config_dir = tmp_path / "config"
@@ -158,6 +169,11 @@ class TestSecrets:
         assert s.jwt.secret_key == "change-me-in-production"
         assert s.jwt.algorithm == "HS256"
 
+    def test_secrets_are_frozen(self):
+        s = Secrets()
+        with pytest.raises(ValidationError):
+            s.jwt.secret_key = "other"
+
 
 # ===================================================================
 # AppSettings
@@ -224,3 +240,22 @@ class TestLoadSettings:
             settings = load_settings()
             assert settings.code_search.repo_map_top_n == 15
             assert settings.secrets.jwt.secret_key == "test-key"
+
+
+class TestLoadYamlCache:
+    def test_repeat_loads_return_independent_copies(self, tmp_path):
+        path = tmp_path / "conductor.settings.yaml"
+        path.write_text(yaml.dump({"server": {"port": 9000}}))
+
+        first = _load_yaml(path)
+        first["server"]["port"] = 1
+
+        assert _load_yaml(path) == {"server": {"port": 9000}}
+
+    def test_edited_file_is_reparsed(self, tmp_path):
+        path = tmp_path / "conductor.settings.yaml"
+        path.write_text(yaml.dump({"server": {"port": 9000}}))
+        assert _load_yaml(path)["server"]["port"] == 9000
+
+        path.write_text(yaml.dump({"server": {"port": 12345}}))
+        assert _load_yaml(path)["server"]["port"] == 12345
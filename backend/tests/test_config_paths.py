@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from app.config import load_config
+from app.config import ConductorConfig, load_config
 
 
 def test_audit_path_relative_to_project_root_when_settings_in_config_dir(tmp_path):
@@ -44,3 +44,18 @@ def test_audit_path_absolute_remains_unchanged(tmp_path):
 
     cfg = load_config(settings_path=settings_file)
     assert Path(cfg.logging.audit_path) == absolute_path
+
+
+def test_loaded_config_round_trips_through_validation(tmp_path):
+    """load_config skips top-level validation; the result must still be a valid model."""
+    settings_file = tmp_path / "conductor.settings.yaml"
+    settings_file.write_text(
+        "summary:\n  enabled: true\nai_models:\n  - id: m1\n    provider: anthropic\n    model_name: x\n",
+        encoding="utf-8",
+    )
+    secrets_file = tmp_path / "conductor.secrets.yaml"
+    secrets_file.write_text("", encoding="utf-8")
+
+    cfg = load_config(settings_path=settings_file, secrets_path=secrets_file)
+    assert ConductorConfig.model_validate(cfg.model_dump()) == cfg
+    assert cfg.session.max_participants == 50
@@ -0,0 +1,157 @@
+"""Tests for the chat stack trace parser."""
+
+import time
+
+from app.chat.stack_trace_parser import (
+    _MAX_CACHED_TRACE_CHARS,
+    StackTraceLanguage,
+    _parse_cached,
+    clear_parse_cache,
+    parse_stack_trace,
+)
+
+PYTHON_TRACE = """Traceback (most recent call last):
+  File "/app/main.py", line 10, in <module>
+    main()
+  File "/usr/lib/python3.11/asyncio/runners.py", line 44, in run
+    return loop.run_until_complete(main)
+AttributeError: 'NoneType' object has no attribute 'attr'
+"""
+
+JS_TRACE = """TypeError: Cannot read properties of null (reading 'x')
+    at Object.render (/home/u/app/src/view.ts:42:10)
+    at process (/home/u/app/node_modules/lib/index.js:7)
+    at /home/u/app/src/main.ts:3:5
+    at ./rel/file.js:9
+"""
+
+JAVA_TRACE = """Exception in thread "main" java.lang.NullPointerException: boom
+\tat com.example.App.process(App.java:42)
+\tat java.util.ArrayList.get(ArrayList.java:427)
+"""
+
+GO_TRACE = """panic: runtime error: index out of range [5] with length 3
+
+goroutine 1 [running]:
+main.process(...)
+\t/home/u/app/main.go:42 +0x68
+runtime.main()
+\t/usr/local/go/src/runtime/proc.go:250 +0x212
+"""
+
+
+def test_python_trace():
+    parsed = parse_stack_trace(PYTHON_TRACE)
+    assert parsed.language == StackTraceLanguage.PYTHON
+    assert parsed.error_type == "AttributeError"
+    assert parsed.error_message == "'NoneType' object has no attribute 'attr'"
+    assert [(f.file_path, f.line_number, f.function_name) for f in parsed.frames] == [
+        ("/app/main.py", 10, "<module>"),
+        ("/usr/lib/python3.11/asyncio/runners.py", 44, "run"),
+    ]
+    assert [f.is_internal for f in parsed.frames] == [False, True]
+
+
+def test_javascript_trace_variants():
+    parsed = parse_stack_trace(JS_TRACE)
+    assert parsed.language == StackTraceLanguage.JAVASCRIPT
+    assert parsed.error_type == "TypeError"
+    assert [(f.file_path, f.line_number, f.column_number, f.function_name) for f in parsed.frames] == [
+        ("/home/u/app/src/view.ts", 42, 10, "Object.render"),
+        ("/home/u/app/node_modules/lib/index.js", 7, None, "process"),
+        ("/home/u/app/src/main.ts", 3, 5, None),
+        ("./rel/file.js", 9, None, None),
+    ]
+    assert parsed.frames[1].is_internal
+
+
+def test_java_trace():
+    parsed = parse_stack_trace(JAVA_TRACE)
+    assert parsed.language == StackTraceLanguage.JAVA
+    assert parsed.error_type == "NullPointerException"
+    assert parsed.error_message == "boom"
+    assert parsed.frames[0].file_path == "com/example/App.java"
+    assert parsed.frames[0].function_name == "App.process"
+
+
+def test_go_trace():
+    parsed = parse_stack_trace(GO_TRACE)
+    assert parsed.language == StackTraceLanguage.GO
+    assert parsed.error_type == "panic"
+    assert parsed.error_message.startswith("runtime error: index out of range")
+    assert [(f.file_path, f.line_number, f.function_name) for f in parsed.frames] == [
+        ("/home/u/app/main.go", 42, "main.process"),
+        ("/usr/local/go/src/runtime/proc.go", 250, "runtime.main"),
+    ]
+
+
+def test_unrecognised_text_has_no_frames():
+    parsed = parse_stack_trace("just some text\nwith no frames\n")
+    assert parsed.language == StackTraceLanguage.UNKNOWN
+    assert parsed.frames == []
+
+
+def test_to_dict_uses_camel_case_keys():
+    data = parse_stack_trace(JS_TRACE).to_dict()
+    assert data["language"] == "javascript"
+    assert data["frames"][0] == {
+        "raw": "    at Object.render (/home/u/app/src/view.ts:42:10)",
+        "filePath": "/home/u/app/src/view.ts",
+        "lineNumber": 42,
+        "columnNumber": 10,
+        "functionName": "Object.render",
+        "isInternal": False,
+    }
+    assert data["rawText"] == JS_TRACE
+
+
+def test_repeat_parses_return_independent_results():
+    first = parse_stack_trace(PYTHON_TRACE)
+    first.frames.clear()
+    first.error_type = "Mutated"
+
+    second = parse_stack_trace(PYTHON_TRACE)
+    assert second is not first
+    assert second.error_type == "AttributeError"
+    assert len(second.frames) == 2
+
+
+def test_mixed_line_breaks_split_like_splitlines():
+    text = PYTHON_TRACE.replace("\n", "\u2028", 2)
+    parsed = parse_stack_trace(text)
+    assert parsed.error_type == "AttributeError"
+    assert [f.line_number for f in parsed.frames] == [10, 44]
+
+
+def test_js_frame_without_function_name():
+    parsed = parse_stack_trace("Error: boom\n    at   (/home/u/app/src/view.ts:42:10)\n")
+    assert [(f.file_path, f.line_number, f.function_name) for f in parsed.frames] == [
+        ("/home/u/app/src/view.ts", 42, ""),
+    ]
+
+
+def test_crafted_lines_parse_in_linear_time():
+    n = 50_000
+    for text in ("  at " + "a (" * n, 'File "a' * n, "at " + " (" * n, "at" + " " * n + "x"):
+        start = time.perf_counter()
+        parse_stack_trace(text)
+        assert time.perf_counter() - start < 1.0
+
+
+def test_crlf_trace_matches_lf_trace():
+    crlf = parse_stack_trace(PYTHON_TRACE.replace("\n", "\r\n") + "\r\n\r\n")
+    lf = parse_stack_trace(PYTHON_TRACE)
+    assert (crlf.error_type, crlf.error_message) == (lf.error_type, lf.error_message)
+    assert [(f.raw, f.function_name) for f in crlf.frames] == [(f.raw, f.function_name) for f in lf.frames]
+
+
+def test_large_traces_are_not_memoised():
+    clear_parse_cache()
+    big = PYTHON_TRACE + "\n" * _MAX_CACHED_TRACE_CHARS
+    assert parse_stack_trace(big).error_type == "AttributeError"
+    assert _parse_cached.cache_info().currsize == 0
+
+    parse_stack_trace(PYTHON_TRACE)
+    assert _parse_cached.cache_info().currsize == 1
+    clear_parse_cache()
+    assert _parse_cached.cache_info().currsize == 0